@@ -1,7 +1,11 @@
 """Main script for wind turbine blade analysis."""
 
 # Standard library imports
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
 from pathlib import Path
+import re
 import sys
 
 # Add project root to Python path to ensure imports work correctly
@@ -12,7 +16,12 @@ sys.path.insert(0, str(project_root))
 import matplotlib.pyplot as plt
 
 # Local imports
-from src.Airfoil import Airfoil, plot_airfoil_shapes
+from src.Airfoil import (
+    Airfoil,
+    load_airfoil_cache,
+    plot_airfoil_shapes,
+    save_airfoil_cache,
+)
 from src.Blade import Blade
 from src.OperationalCharacteristics import (
     OperationalCharacteristics,
@@ -20,7 +29,7 @@ from src.OperationalCharacteristics import (
 from src.OperationalCondition import OperationalCondition
 from src.BladeElementTheory import BladeElementTheory
 from src.PerformanceAnalyzer import PerformanceAnalyzer
-from src import save_results, save_plots
+from src import save_results, save_plots, save_performance_curves
 
 # Input _______________________________________________________________________
 
@@ -50,130 +59,192 @@ airfoil_indices = [0, 4, 9, 14, 19, 24, 29, 34, 39, 44, 49]
 # Define the blade data source
 Data_Source = "IEA-15-240-RWT"  # Data source name
 
+# Define console output; use logging.WARNING to silence progress in batch runs
+log_level = logging.INFO
+
 # Loading Data ________________________________________________________________
 
-# Set the Data source base path - now using project_root
-base_path = project_root / "inputs" / Data_Source
+log = logging.getLogger("windwizards")
 
-# Load airfoils into a dictionary
-print("Loading airfoils...")
-airfoil_map = {}
+AIRFOIL_INDEX_RE = re.compile(r"AF(\d+)_Coords")
 
-# Iterate through all coordinate files in the Airfoils directory
-for coord_file in (base_path / "Airfoils").glob("IEA-15-240-RWT_AF*_Coords.txt"):
-    # Extract the index from the filename
-    idx = coord_file.stem.split("_")[-2][2:]
-    polar_file = base_path / f"Airfoils/IEA-15-240-RWT_AeroDyn15_Polar_{idx}.dat"
 
-    # Create Airfoil object and load data from the files
+def load_airfoil(idx, coord_file, polar_file):
+    """Load one airfoil from its coordinate file and the matching polar file."""
     airfoil = Airfoil(name="", reynolds=0.0, control=0, incl_ua_data=False)
     airfoil.load_from_polar_and_coords(coord_file, polar_file)
-
-    # Store the Airfoil in the map
-    airfoil_map[int(idx)] = airfoil
-
-print(f"Loaded {len(airfoil_map)} airfoils")
-
-# Load operational conditions
-print("Loading operational characteristics...")
-opt_file = base_path / "IEA_15MW_RWT_Onshore.opt"
-ops = OperationalCharacteristics()
-ops.load_from_file(opt_file)
-print(f"Loaded {len(ops.characteristics)} operational characteristics")
-
-# Load blade data
-print("Loading blade...")
-blade_file = base_path / "IEA-15-240-RWT_AeroDyn15_blade.dat"
-# Initialize blade with operational characteristics
-blade = Blade(operational_characteristics=ops)
-blade.load_from_file(file_path=blade_file, airfoil_map=airfoil_map)
-print(f"Loaded blade with {len(blade.elements)} elements")
-# print(f"Blade characteristic: {blade.operational_characteristics} m")
-# ops.plot_characteristics(V_min=0, V_max=30, num_points=100)
-
-# Processing  Data _______________________________________________________
-
-# Create operational condition object
-operational_condition = OperationalCondition(
-    wind_speed=wind_speed, rho=rho, num_blades=num_blades)
-operational_condition.calculate_angular_velocity(blade=blade)
-print("-" * 40)
-print(operational_condition)
-
-# Calculate induction factors for each blade element
-print("Calculating induction factors for each blade element...")
-blade.compute_induction_factors_blade(
-    operational_condition=operational_condition)
-
-# Run blade element momentum theory
-print("Running blade element momentum theory...")
-bet = BladeElementTheory(blade=blade)
-result = bet.compute_aerodynamic_performance(
-    operational_condition=operational_condition)
-aerodata_at_radius = bet.compute_induction_factors(
+    return idx, airfoil
+
+
+def load_airfoils(base_path):
+    """Load all airfoils of a data source, reusing the .npz cache if it is current."""
+    # Resolve every (index, coordinate file, polar file) triple up front, in
+    # index order, so the concurrent load below is deterministic
+    coord_files = sorted(
+        (int(AIRFOIL_INDEX_RE.search(path.name).group(1)), path)
+        for path in (base_path / "Airfoils").glob("IEA-15-240-RWT_AF*_Coords.txt")
+    )
+    indices = [idx for idx, _ in coord_files]
+    coord_paths = [path for _, path in coord_files]
+    polar_files = [
+        path.with_name(path.name.replace("_AF", "_AeroDyn15_Polar_")
+                       .replace("_Coords.txt", ".dat"))
+        for path in coord_paths
+    ]
+
+    # Reuse the airfoils parsed on a previous run, unless the cache format or
+    # the set of source files has changed or a source file is newer
+    sources = [path.name for path in coord_paths + polar_files]
+    airfoil_cache = (
+        project_root / "outputs" / "cache" / f"{base_path.name}_airfoils.npz")
+    if airfoil_cache.exists():
+        cache_mtime = airfoil_cache.stat().st_mtime
+        if all(path.stat().st_mtime <= cache_mtime
+               for path in coord_paths + polar_files):
+            airfoil_map = load_airfoil_cache(airfoil_cache, sources)
+            if airfoil_map is not None:
+                return airfoil_map
+
+    # The files are independent, so they are read and parsed concurrently
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        airfoil_map = dict(executor.map(
+            load_airfoil, indices, coord_paths, polar_files))
+    save_airfoil_cache(airfoil_cache, airfoil_map, sources)
+    return airfoil_map
+
+
+def run(
+    data_source=Data_Source,
+    wind_speed=wind_speed,
+    rho=rho,
+    num_blades=num_blades,
     radius=radius,
-    a_guess=a_guess,
-    a_prime_guess=a_prime_guess,
-    max_iterations=max_iterations,
-    tolerance=tolerance,
-    operational_characteristics=ops,
-    operational_condition=operational_condition,
-)
-
-# Calculate aerodynamic performance for the specified wind speed range
-performance_analyzer = PerformanceAnalyzer(
-    blade=blade, min_wind_speed=1, max_wind_speed=30, num_points=100
-)
-
-
-# Results _____________________________________________________________
-
-# Plot selected airfoil shapes
-print("\nPlotting selected airfoil shapes...")
-plot_airfoil_shapes(list(airfoil_map.values()), airfoil_indices)
-
-print("Plotting blade shape...")
-blade.plot_blade_shape(15)
-
-print("Plotting Power, Thrust, Torque...")
-performance_analyzer.plot_power_curve()
-performance_analyzer.plot_thrust_curve()
-performance_analyzer.plot_torque_curve()
-
-# Print aerodynamic data for the specified radius
-print("-" * 40)
-
-print(f"\nAerodynamic data at radius {radius} m:")
-print(f"Radius: {aerodata_at_radius['radius']:.2f} m")
-print(f"Axial induction factor (a): {aerodata_at_radius['a']:.4f}")
-print(f"Tangential induction factor (a'): {aerodata_at_radius['a_prime']:.4f}")
-print(f"Angle of attack (alpha): {aerodata_at_radius['alpha']:.2f} degrees")
-print(f"Lift coefficient (Cl): {aerodata_at_radius['cl']:.4f}")
-print(f"Drag coefficient (Cd): {aerodata_at_radius['cd']:.4f}")
-print(f"Flow angle (phi): {aerodata_at_radius['phi']:.2f} degrees")
-print(f"Normal force coefficient (Cn): {aerodata_at_radius['Cn']:.4f}")
-print(f"Thrust force coefficient (Ct): {aerodata_at_radius['Ct']:.4f}")
-
-print("-" * 40)
-
-print("Aerodynamic performance results:")
-print(f"Total Thrust: {result[0]:.2f} N")
-print(f"Total Torque: {result[1]:.2f} Nm")
-print(f"Total Power: {result[2]:.2f} W")
-print(f"Thrust Coefficient (CT): {result[3]:.2f}")
-print(f"Power Coefficient (CP): {result[4]:.2f}")
-
-print("-" * 40)
-
-# Save results and plots - using project_root for output paths
-output_folder = project_root / "outputs" / f"wind_speed_{operational_condition.wind_speed}ms"
-output_file = output_folder / "results.txt"
-
-# Save all results and plots
-save_results(operational_condition, result, output_file, Data_Source)
-save_plots(output_folder, performance_analyzer)
-
-print(f"Results and plots saved in {output_folder}")
-print("-" * 40)
-
-plt.show()
+    show_plots=True,
+):
+    """
+    Load a data source, solve BEM at one wind speed and save the results.
+
+    Returns:
+        tuple: (result, aerodata_at_radius, performance_analyzer) where result is
+               (thrust, torque, power, CT, CP) at the given wind speed.
+    """
+    # Set the Data source base path - now using project_root
+    base_path = project_root / "inputs" / data_source
+
+    # Load airfoils into a dictionary
+    log.info("Loading airfoils...")
+    airfoil_map = load_airfoils(base_path)
+    log.info("Loaded %d airfoils", len(airfoil_map))
+
+    # Load operational conditions
+    log.info("Loading operational characteristics...")
+    opt_file = base_path / "IEA_15MW_RWT_Onshore.opt"
+    ops = OperationalCharacteristics()
+    ops.load_from_file(opt_file)
+    log.info("Loaded %d operational characteristics", len(ops.characteristics))
+
+    # Load blade data
+    log.info("Loading blade...")
+    blade_file = base_path / "IEA-15-240-RWT_AeroDyn15_blade.dat"
+    # Initialize blade with operational characteristics
+    blade = Blade(operational_characteristics=ops)
+    blade.load_from_file(file_path=blade_file, airfoil_map=airfoil_map)
+    log.info("Loaded blade with %d elements", len(blade.elements))
+
+    # Processing  Data _______________________________________________________
+
+    # Create operational condition object
+    operational_condition = OperationalCondition(
+        wind_speed=wind_speed, rho=rho, num_blades=num_blades)
+    operational_condition.calculate_angular_velocity(blade=blade)
+    log.info("-" * 40)
+    log.info("%s", operational_condition)
+    tip_speed_ratio = blade.calculate_tip_speed_ratio(
+        wind_speed, operational_condition.omega)
+    log.info("  Tip Speed Ratio: %.2f", tip_speed_ratio)
+
+    # Calculate induction factors for each blade element
+    log.info("Calculating induction factors for each blade element...")
+    blade.compute_induction_factors_blade(
+        operational_condition=operational_condition)
+
+    # Run blade element momentum theory
+    log.info("Running blade element momentum theory...")
+    bet = BladeElementTheory(blade=blade)
+    result = bet.compute_aerodynamic_performance(
+        operational_condition=operational_condition)
+    aerodata_at_radius = bet.compute_induction_factors(
+        radius=radius,
+        a_guess=a_guess,
+        a_prime_guess=a_prime_guess,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+        operational_characteristics=ops,
+        operational_condition=operational_condition,
+    )
+
+    # Calculate aerodynamic performance for the specified wind speed range
+    performance_analyzer = PerformanceAnalyzer(
+        blade=blade, min_wind_speed=1, max_wind_speed=30, num_points=100
+    )
+
+    # Results _____________________________________________________________
+
+    if show_plots:
+        # Plot selected airfoil shapes
+        log.info("Plotting selected airfoil shapes...")
+        plot_airfoil_shapes(list(airfoil_map.values()), airfoil_indices)
+
+        log.info("Plotting blade shape...")
+        blade.plot_blade_shape(15)
+
+        log.info("Plotting Power, Thrust, Torque...")
+        performance_analyzer.plot_power_curve()
+        performance_analyzer.plot_thrust_curve()
+        performance_analyzer.plot_torque_curve()
+
+    # Print aerodynamic data for the specified radius
+    log.info("-" * 40)
+
+    log.info("Aerodynamic data at radius %s m:", radius)
+    log.info("Radius: %.2f m", aerodata_at_radius["radius"])
+    log.info("Axial induction factor (a): %.4f", aerodata_at_radius["a"])
+    log.info("Tangential induction factor (a'): %.4f", aerodata_at_radius["a_prime"])
+    log.info("Angle of attack (alpha): %.2f degrees", aerodata_at_radius["alpha"])
+    log.info("Lift coefficient (Cl): %.4f", aerodata_at_radius["cl"])
+    log.info("Drag coefficient (Cd): %.4f", aerodata_at_radius["cd"])
+    log.info("Flow angle (phi): %.2f degrees", aerodata_at_radius["phi"])
+    log.info("Normal force coefficient (Cn): %.4f", aerodata_at_radius["Cn"])
+    log.info("Thrust force coefficient (Ct): %.4f", aerodata_at_radius["Ct"])
+
+    log.info("-" * 40)
+
+    log.info("Aerodynamic performance results:")
+    log.info("Total Thrust: %.2f N", result[0])
+    log.info("Total Torque: %.2f Nm", result[1])
+    log.info("Total Power: %.2f W", result[2])
+    log.info("Thrust Coefficient (CT): %.2f", result[3])
+    log.info("Power Coefficient (CP): %.2f", result[4])
+
+    log.info("-" * 40)
+
+    # Save results and plots - using project_root for output paths
+    output_folder = project_root / "outputs" / \
+        f"wind_speed_{operational_condition.wind_speed}ms"
+    output_file = output_folder / "results.txt"
+
+    # Save all results and plots
+    save_results(operational_condition, result, output_file, data_source)
+    save_plots(output_folder, performance_analyzer)
+    save_performance_curves(output_folder, performance_analyzer)
+
+    log.info("Results and plots saved in %s", output_folder)
+    log.info("-" * 40)
+
+    return result, aerodata_at_radius, performance_analyzer
+
+
+if __name__ == "__main__":
+    logging.basicConfig(format="%(message)s", level=log_level)
+    run()
+    plt.show()
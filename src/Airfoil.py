@@ -1,7 +1,59 @@
+import io
+import mmap
+import re
+import zipfile
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+import numpy as np
 import matplotlib.pyplot as plt
 
+# Airfoil number in a coordinate file name, e.g. "IEA-15-240-RWT_AF07_Coords"
+_AF_NUMBER_RE = re.compile(r"AF(\d+)")
+# Header markers of the coordinate and polar files, matched in a single search
+_COORD_MARKER_RE = re.compile(
+    rb"! x-y coordinate of airfoil reference|! coordinates of airfoil shape|NumCoords")
+_POLAR_MARKER_RE = re.compile(
+    rb"! Reynolds number in millions|Ctrl|InclUAdata|NumAlf")
+# Lines between the NumAlf marker and the first row of the coefficient table
+_POLAR_PREAMBLE_RE = re.compile(rb"\s*(?:(?i:alpha)|\(|!|$)")
+
+# Format of the archives written by save_airfoil_cache; increase it whenever
+# parsing or the stored arrays change, so that older archives are not reused
+AIRFOIL_CACHE_VERSION = 2
+
+# Record layout of one polar row, used for aero_data
+AERO_DTYPE = np.dtype(
+    [("alpha", np.float64), ("cl", np.float64), ("cd", np.float64), ("cm", np.float64)])
+
+
+class _AeroRecords(np.recarray):
+    """Polar rows of an airfoil; like the former list, empty tables are falsy."""
+
+    def __bool__(self):
+        return self.size > 0
+
+
+@contextmanager
+def _map_file(path: Path):
+    """
+    Memory-maps a file for reading without decoding it into Python strings.
+
+    Args:
+        path (Path): Path to the file.
+
+    Yields:
+        A read-only mmap (an empty BytesIO for empty files) supporting
+        readline(), read(), seek() and tell().
+    """
+    with open(path, "rb") as file:
+        if path.stat().st_size == 0:
+            yield io.BytesIO()
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
 
 class AeroCoefficients:
     """
@@ -40,8 +92,12 @@ class Airfoil:
         control (int): Control parameter.
         incl_ua_data (bool): Whether unsteady aerodynamic data is included.
         ref_coord (Tuple[float, float]): Reference coordinate of the airfoil.
-        shape_coords (List[Tuple[float, float]]): List of shape coordinates (x, y).
-        aero_data (List[AeroCoefficients]): List of aerodynamic coefficients.
+        shape_coords (np.ndarray): Shape coordinates (x, y) as an (N, 2) array.
+        aero_data (np.recarray): Read-only polar rows with the AERO_DTYPE layout.
+        alpha_arr (np.ndarray): Angles of attack in degrees.
+        cl_arr (np.ndarray): Lift coefficients.
+        cd_arr (np.ndarray): Drag coefficients.
+        cm_arr (np.ndarray): Moment coefficients.
     """
 
     def __init__(
@@ -64,15 +120,167 @@ class Airfoil:
             incl_ua_data (bool): Whether unsteady aerodynamic data is included.
             ref_coord (Optional[Tuple[float, float]]): Reference coordinate of the airfoil.
             shape_coords (Optional[List[Tuple[float, float]]]): List of shape coordinates (x, y).
-            aero_data (Optional[List[AeroCoefficients]]): List of aerodynamic coefficients.
+            aero_data (Optional[List[AeroCoefficients]]): Aerodynamic coefficients, as a
+                list of AeroCoefficients or a record array with the AERO_DTYPE fields.
         """
         self.name = name
         self.reynolds = reynolds
         self.control = control
         self.incl_ua_data = incl_ua_data
         self.ref_coord = ref_coord if ref_coord else (0.0, 0.0)
-        self.shape_coords = shape_coords if shape_coords else []
-        self.aero_data = aero_data if aero_data else []
+        self.shape_coords = np.asarray(
+            shape_coords if shape_coords is not None else [], dtype=np.float64
+        ).reshape(-1, 2)
+        self.aero_data = aero_data if aero_data is not None else []
+
+    @property
+    def aero_data(self) -> np.recarray:
+        """
+        Aerodynamic coefficients as a record array with one row per angle of attack.
+
+        Rows support attribute access (row.alpha, row.cl, row.cd, row.cm) like
+        AeroCoefficients, without allocating a Python object per row. The rows
+        and the coefficient arrays are read-only; assign a new table to
+        aero_data to change the polar.
+
+        Returns:
+            np.recarray: Polar rows with the AERO_DTYPE layout.
+        """
+        return self._aero_data
+
+    @aero_data.setter
+    def aero_data(self, aero_data):
+        """
+        Sets the coefficient arrays from polar rows.
+
+        Args:
+            aero_data: Record array with the AERO_DTYPE fields, or a list of
+                       AeroCoefficients objects.
+        """
+        if isinstance(aero_data, np.ndarray) and aero_data.dtype.names:
+            self._set_aero_table(np.column_stack(
+                [aero_data[field] for field in AERO_DTYPE.names]))
+        else:
+            self._set_aero_table(
+                [(data.alpha, data.cl, data.cd, data.cm) for data in aero_data])
+
+    @property
+    def aero_table(self) -> np.ndarray:
+        """
+        Aerodynamic coefficients as one (N, 4) array of alpha, cl, cd and cm rows.
+
+        Returns:
+            np.ndarray: View of the coefficient arrays; no data is copied.
+        """
+        return self._aero_block.T
+
+    def _set_aero_table(self, rows):
+        """
+        Stores (alpha, cl, cd, cm) rows as contiguous coefficient arrays.
+
+        The arrays are read-only, so that everything derived from them stays
+        valid until the table is replaced as a whole.
+
+        Args:
+            rows: Sequence of (alpha, cl, cd, cm) rows or an (N, 4) array.
+        """
+        table = np.asarray(rows, dtype=np.float64).reshape(-1, 4)
+        table = table[np.argsort(table[:, 0], kind="stable")]
+        # One (4, N) block; each coefficient row is a contiguous view into it
+        self._aero_block = np.ascontiguousarray(table.T)
+        self._aero_block.flags.writeable = False
+        self.alpha_arr, self.cl_arr, self.cd_arr, self.cm_arr = self._aero_block
+
+        # Per-segment secants, computed once for interp_fast
+        d_alpha = np.diff(self.alpha_arr)
+        nonzero = d_alpha != 0
+        self._cl_slope = np.divide(
+            np.diff(self.cl_arr), d_alpha,
+            out=np.zeros_like(d_alpha), where=nonzero)
+        self._cd_slope = np.divide(
+            np.diff(self.cd_arr), d_alpha,
+            out=np.zeros_like(d_alpha), where=nonzero)
+
+        # Row records of the same table, built once for aero_data
+        self._aero_data = np.rec.fromarrays(
+            self._aero_block, dtype=AERO_DTYPE).view(_AeroRecords)
+        self._aero_data.flags.writeable = False
+
+    def interp(self, alpha):
+        """
+        Interpolates lift and drag coefficients at the given angle(s) of attack.
+
+        Args:
+            alpha (float or np.ndarray): Angle(s) of attack in degrees.
+
+        Returns:
+            tuple: Lift and drag coefficients (cl, cd), shaped like alpha.
+        """
+        return (
+            np.interp(alpha, self.alpha_arr, self.cl_arr),
+            np.interp(alpha, self.alpha_arr, self.cd_arr),
+        )
+
+    def cl_at(self, alpha):
+        """
+        Interpolates the lift coefficient at the given angle(s) of attack.
+
+        Args:
+            alpha (float or np.ndarray): Angle(s) of attack in degrees.
+
+        Returns:
+            float or np.ndarray: Lift coefficient, shaped like alpha.
+        """
+        return np.interp(alpha, self.alpha_arr, self.cl_arr)
+
+    def cd_at(self, alpha):
+        """
+        Interpolates the drag coefficient at the given angle(s) of attack.
+
+        Args:
+            alpha (float or np.ndarray): Angle(s) of attack in degrees.
+
+        Returns:
+            float or np.ndarray: Drag coefficient, shaped like alpha.
+        """
+        return np.interp(alpha, self.alpha_arr, self.cd_arr)
+
+    def cm_at(self, alpha):
+        """
+        Interpolates the moment coefficient at the given angle(s) of attack.
+
+        Args:
+            alpha (float or np.ndarray): Angle(s) of attack in degrees.
+
+        Returns:
+            float or np.ndarray: Moment coefficient, shaped like alpha.
+        """
+        return np.interp(alpha, self.alpha_arr, self.cm_arr)
+
+    def interp_fast(self, alpha):
+        """
+        Interpolates lift and drag coefficients using the precomputed secants.
+
+        Equivalent to interp, but locates the polar segment with a single
+        searchsorted shared by Cl and Cd instead of one search per coefficient.
+
+        Args:
+            alpha (float or np.ndarray): Angle(s) of attack in degrees.
+
+        Returns:
+            tuple: Lift and drag coefficients (cl, cd), shaped like alpha.
+        """
+        if self.alpha_arr.size < 2:
+            return self.interp(alpha)
+
+        alpha = np.clip(alpha, self.alpha_arr[0], self.alpha_arr[-1])
+        i = np.searchsorted(self.alpha_arr, alpha, side="right") - 1
+        i = np.minimum(i, self.alpha_arr.size - 2)
+        offset = alpha - self.alpha_arr[i]
+        return (
+            self.cl_arr[i] + self._cl_slope[i] * offset,
+            self.cd_arr[i] + self._cd_slope[i] * offset,
+        )
 
     def load_from_file(self, file_path: Path):
         """
@@ -81,47 +289,47 @@ class Airfoil:
         Args:
             file_path (Path): Path to the file containing airfoil data.
         """
-        match = file_path.stem.split("AF")
-        number = match[1] if len(match) > 1 else "??"
+        match = _AF_NUMBER_RE.search(file_path.stem)
+        number = match.group(1) if match else "??"
         self.name = f"Airfoil {number}"
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-
         self.ref_coord = None
-        self.shape_coords = []
+        self.shape_coords = np.empty((0, 2))
         num_coords = 0
 
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
+        with _map_file(file_path) as mapped:
+            for line in iter(mapped.readline, b""):
+                marker = _COORD_MARKER_RE.search(line)
+                if marker is None:
+                    continue
+                marker = marker.group()
 
-            if "! x-y coordinate of airfoil reference" in line:
-                if i + 2 < len(lines):
+                if marker == b"! x-y coordinate of airfoil reference":
+                    # The reference point sits two lines below its marker
+                    position = mapped.tell()
+                    mapped.readline()
                     try:
-                        x, y = map(float, lines[i + 2].strip().split())
+                        x, y = map(float, mapped.readline().split())
                         self.ref_coord = (x, y)
-                        i += 2
                     except ValueError:
                         pass
-
-            elif "! coordinates of airfoil shape" in line:
-                for j in range(i + 2, i + 2 + num_coords):
-                    if j < len(lines):
-                        parts = lines[j].strip().split()
-                        if len(parts) == 2:
-                            try:
-                                x, y = map(float, parts)
-                                self.shape_coords.append((x, y))
-                            except ValueError:
-                                pass
-                i += num_coords - 1
-
-            elif "NumCoords" in line:
-                try:
-                    num_coords = int(line.split()[0])
-                except ValueError:
-                    pass
-
-            i += 1
+                    mapped.seek(position)
+
+                elif marker == b"! coordinates of airfoil shape":
+                    if num_coords > 0:
+                        self.shape_coords = np.loadtxt(
+                            io.BytesIO(mapped.read()),
+                            comments="!",
+                            usecols=(0, 1),
+                            max_rows=num_coords,
+                            ndmin=2,
+                        )
+                    break
+
+                else:
+                    try:
+                        num_coords = int(line.split()[0])
+                    except ValueError:
+                        pass
 
     def load_from_polar_and_coords(self, coord_path: Path, polar_path: Path):
         """
@@ -133,50 +341,103 @@ class Airfoil:
         """
         self.load_from_file(coord_path)
 
-        self.aero_data = []
         self.reynolds = 0.0
         self.control = 0
         self.incl_ua_data = False
-        parsing_data = False
-
-        lines = polar_path.read_text(encoding="utf-8").splitlines()
 
-        for line in lines:
-            stripped = line.strip()
+        with _map_file(polar_path) as mapped:
+            # Scan the header up to the start of the coefficient table
+            num_alf = None
+            for line in iter(mapped.readline, b""):
+                marker = _POLAR_MARKER_RE.search(line)
+                if marker is None:
+                    continue
+                marker = marker.group()
+                value = line.split()[0]
 
-            if "! Reynolds number in millions" in stripped:
-                try:
-                    self.reynolds = float(stripped.split()[0]) * 10**6
-                except ValueError:
-                    pass
+                if marker == b"! Reynolds number in millions":
+                    try:
+                        self.reynolds = float(value) * 10**6
+                    except ValueError:
+                        pass
 
-            elif "Ctrl" in stripped:
-                try:
-                    self.control = int(stripped.split()[0])
-                except ValueError:
-                    pass
+                elif marker == b"Ctrl":
+                    try:
+                        self.control = int(value)
+                    except ValueError:
+                        pass
 
-            elif "InclUAdata" in stripped:
-                self.incl_ua_data = stripped.split()[0].lower() == "true"
+                elif marker == b"InclUAdata":
+                    self.incl_ua_data = value.lower() == b"true"
 
-            elif "NumAlf" in stripped:
-                parsing_data = True
-                continue
+                else:
+                    try:
+                        num_alf = int(value)
+                    except ValueError:
+                        pass
+                    break
+            else:
+                self._set_aero_table([])
+                return
+
+            # Skip column header lines that are not marked as comments
+            position = mapped.tell()
+            for line in iter(mapped.readline, b""):
+                if not _POLAR_PREAMBLE_RE.match(line):
+                    break
+                position = mapped.tell()
+            mapped.seek(position)
+
+            self._set_aero_table(
+                np.loadtxt(
+                    io.BytesIO(mapped.read()),
+                    comments="!",
+                    usecols=(0, 1, 2, 3),
+                    max_rows=num_alf,
+                    ndmin=2,
+                )
+            )
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Converts the airfoil into a dictionary of NumPy arrays.
 
-            if parsing_data:
-                if stripped.lower().startswith(
-                        "alpha") or stripped.startswith("("):
-                    continue
+        Returns:
+            Dict[str, np.ndarray]: Arrays describing the airfoil, suitable for np.savez.
+        """
+        return {
+            "name": np.array(self.name),
+            "reynolds": np.array(self.reynolds, dtype=np.float64),
+            "control": np.array(self.control),
+            "incl_ua_data": np.array(self.incl_ua_data),
+            "ref_coord": np.array(
+                self.ref_coord if self.ref_coord is not None else [], dtype=np.float64),
+            "shape": self.shape_coords,
+            "aero": self.aero_table,
+        }
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "Airfoil":
+        """
+        Creates an Airfoil object from arrays produced by to_arrays.
 
-                parts = stripped.split()
-                if len(parts) < 4:
-                    continue
+        Args:
+            arrays (Dict[str, np.ndarray]): Arrays describing the airfoil.
 
-                try:
-                    alpha, cl, cd, cm = map(float, parts[:4])
-                    self.aero_data.append(AeroCoefficients(alpha, cl, cd, cm))
-                except ValueError:
-                    continue
+        Returns:
+            Airfoil: The reconstructed Airfoil object.
+        """
+        airfoil = cls(
+            name=str(arrays["name"]),
+            reynolds=float(arrays["reynolds"]),
+            control=int(arrays["control"]),
+            incl_ua_data=bool(arrays["incl_ua_data"]),
+            shape_coords=arrays["shape"],
+        )
+        ref_coord = arrays["ref_coord"]
+        airfoil.ref_coord = tuple(ref_coord.tolist()) if ref_coord.size else None
+        airfoil._set_aero_table(arrays["aero"])
+        return airfoil
 
     def __repr__(self):
         """
@@ -188,10 +449,71 @@ class Airfoil:
         return (
             f"Airfoil(name={self.name}, reynolds={self.reynolds}, control={self.control}, "
             f"incl_ua_data={self.incl_ua_data}, ref_coord={self.ref_coord}, "
-            f"num_shape_coords={len(self.shape_coords)}, num_aero_data={len(self.aero_data)})"
+            f"num_shape_coords={len(self.shape_coords)}, num_aero_data={len(self.alpha_arr)})"
         )
 
 
+def save_airfoil_cache(
+        cache_path: Path,
+        airfoil_map: Dict[int, Airfoil],
+        sources: List[str] = ()):
+    """
+    Saves a mapping of airfoils to a single compressed .npz archive.
+
+    Args:
+        cache_path (Path): Path of the .npz archive to write.
+        airfoil_map (Dict[int, Airfoil]): Mapping of airfoil IDs to Airfoil objects.
+        sources (List[str]): Names of the files the airfoils were parsed from.
+    """
+    arrays = {
+        f"{idx}/{key}": value
+        for idx, airfoil in airfoil_map.items()
+        for key, value in airfoil.to_arrays().items()
+    }
+    arrays["meta/version"] = np.array(AIRFOIL_CACHE_VERSION)
+    arrays["meta/sources"] = np.array([str(source) for source in sources], dtype=str)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+
+
+def load_airfoil_cache(
+        cache_path: Path,
+        sources: Optional[List[str]] = None) -> Optional[Dict[int, Airfoil]]:
+    """
+    Loads a mapping of airfoils from an archive written by save_airfoil_cache.
+
+    Args:
+        cache_path (Path): Path of the .npz archive to read.
+        sources (Optional[List[str]]): If given, the archive must have been
+            written from exactly these source files.
+
+    Returns:
+        Optional[Dict[int, Airfoil]]: Mapping of airfoil IDs to Airfoil objects,
+            or None if the archive was written by another cache format version
+            or from other source files, or cannot be read.
+    """
+    grouped = {}
+    try:
+        with np.load(cache_path) as data:
+            if "meta/version" not in data.files or (
+                    int(data["meta/version"]) != AIRFOIL_CACHE_VERSION):
+                return None
+            if sources is not None and (
+                    data["meta/sources"].tolist() != [str(source) for source in sources]):
+                return None
+
+            for name in data.files:
+                idx, key = name.split("/", 1)
+                if idx != "meta":
+                    grouped.setdefault(int(idx), {})[key] = data[name]
+
+        return {idx: Airfoil.from_arrays(arrays) for idx, arrays in grouped.items()}
+    except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile, zlib.error):
+        # A truncated or corrupt archive is treated like a stale one
+        return None
+
+
 def plot_airfoil_shapes(airfoils: List[Airfoil], indices: List[int]):
     """
     Plots the shapes of multiple airfoils.
@@ -204,8 +526,8 @@ def plot_airfoil_shapes(airfoils: List[Airfoil], indices: List[int]):
 
     for idx in indices:
         airfoil = airfoils[idx]
-        x, y = zip(*airfoil.shape_coords)
-        plt.plot(x, y, label=f"{airfoil.name}")
+        coords = np.asarray(airfoil.shape_coords)
+        plt.plot(coords[:, 0], coords[:, 1], label=f"{airfoil.name}")
 
     plt.axis("equal")
     plt.title("Airfoil Shapes")
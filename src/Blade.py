@@ -1,14 +1,28 @@
+import re
 from pathlib import Path
 from typing import List, Dict
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib import cm
-from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+from matplotlib.lines import Line2D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection, Poly3DCollection
 
 from mpl_toolkits.mplot3d import Axes3D
 from src.Airfoil import Airfoil
-from src.BladeElement import BladeElement
-from src.OperationalCharacteristics import OperationalCharacteristics
+from src.BladeElement import BladeElement, _aitken, induction_fixed_point
+from src.OperationalCharacteristics import (
+    _FLOAT,
+    _UNSIGNED_FLOAT,
+    OperationalCharacteristics,
+)
+
+# A blade node row: unsigned radius, five numeric columns and an integer
+# airfoil ID. Headers, dividers and malformed rows do not match.
+_NODE_ROW_RE = re.compile(
+    rf"^[ \t]*{_UNSIGNED_FLOAT}"
+    rf"(?:[ \t]+{_FLOAT}){{5}}[ \t]+[-+]?\d+(?=\s|$).*$",
+    re.MULTILINE,
+)
 
 
 class Blade:
@@ -29,6 +43,63 @@ class Blade:
         self.R = None  # Tip radius
         self.operational_characteristics = operational_characteristics
 
+    @property
+    def elements(self) -> List[BladeElement]:
+        """List of blade elements."""
+        return self._elements
+
+    @elements.setter
+    def elements(self, elements: List[BladeElement]):
+        """
+        Set the blade elements and rebuild the per-element geometry arrays.
+
+        Parameters:
+        - elements (List[BladeElement]): List of blade elements.
+        """
+        self._elements = elements
+        self._build_arrays()
+
+    def _build_arrays(self):
+        """
+        Build the geometry arrays of a new set of elements.
+
+        Sets the geometry arrays (see update_geometry_arrays) and clears the
+        solver arrays (dr_arr [m], solidity_arr, a_arr, a_prime_arr,
+        phi_arr [rad], Cn_arr, Ct_arr) and the cached polar table until they
+        are recomputed.
+        """
+        self.dr_arr = None
+        self.solidity_arr = None
+        self.a_arr = None
+        self.a_prime_arr = None
+        self.phi_arr = None
+        self.Cn_arr = None
+        self.Ct_arr = None
+        self._polar_cache = None
+        self.update_geometry_arrays()
+
+    def update_geometry_arrays(self):
+        """
+        Store the element geometry as contiguous arrays, one entry per element.
+
+        Sets r_arr [m], chord_arr [m], twist_arr [deg], twist_rad_arr [rad],
+        airfoil_id_arr, and the element indices ordered by radius (r_order_arr)
+        with the matching sorted radii (r_sorted_arr [m]). Every solve calls
+        this, so edits to the elements or to the element list take effect.
+        """
+        count = len(self._elements)
+        self.r_arr = np.fromiter(
+            (element.r for element in self._elements), np.float64, count)
+        self.chord_arr = np.fromiter(
+            (element.chord for element in self._elements), np.float64, count)
+        self.twist_arr = np.fromiter(
+            (element.twist for element in self._elements), np.float64, count)
+        self.twist_rad_arr = np.radians(self.twist_arr)
+        self.r_order_arr = np.argsort(self.r_arr, kind="stable")
+        self.r_sorted_arr = self.r_arr[self.r_order_arr]
+        self.airfoil_id_arr = np.fromiter(
+            (element.airfoil_id for element in self._elements), np.int32, count)
+
     def load_from_file(self, file_path: Path,
                        airfoil_map: Dict[int, Airfoil] = None):
         """
@@ -38,35 +109,33 @@ class Blade:
         - file_path (Path): Path to the file containing blade element data.
         - airfoil_map (Dict[int, Airfoil]): Mapping of airfoil IDs to Airfoil objects.
         """
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-        self.elements = []
-
-        for line in lines:
-            line = line.strip()
-            if not line or line.startswith(("-", "=", "!")):
-                continue  # Skip comments or header lines
-
-            parts = line.split()
-            if len(parts) < 7:
-                continue
-
-            try:
-                r = float(parts[0])  # Radius position
-                twist = float(parts[4])  # Twist angle in degrees
-                chord = float(parts[5])  # Chord length
-                airfoil_id = int(parts[6]) - 1  # Airfoil index
-            except ValueError:
-                continue
-
-            airfoil = airfoil_map.get(airfoil_id) if airfoil_map else None
-            element = BladeElement(
+        # Select the node rows in one regex pass, then parse them in bulk
+        rows = _NODE_ROW_RE.findall(file_path.read_text(encoding="utf-8"))
+        if not rows:
+            self.elements = []
+            return
+
+        table = np.loadtxt(rows, comments="!", usecols=(0, 4, 5, 6), ndmin=2)
+        table = table[np.argsort(table[:, 0], kind="stable")]  # Root to tip
+        airfoil_ids = table[:, 3].astype(int) - 1  # Airfoil index
+
+        elements = [
+            BladeElement(
                 r=r,
                 twist=twist,
                 chord=chord,
                 airfoil_id=airfoil_id,
-                airfoil=airfoil,
+                airfoil=airfoil_map.get(airfoil_id) if airfoil_map else None,
             )
-            self.elements.append(element)
+            for r, twist, chord, airfoil_id in zip(
+                table[:, 0].tolist(),  # Radius position
+                table[:, 1].tolist(),  # Twist angle in degrees
+                table[:, 2].tolist(),  # Chord length
+                airfoil_ids.tolist(),
+            )
+        ]
+
+        self.elements = elements
 
     def calculate_element_discretization_lengths(self):
         """Calculate and assign the discretization length (dr) for each blade element."""
@@ -75,14 +144,57 @@ class Blade:
                 "No blade elements found. Please load blade data first for the function to work."
             )
 
-        for i, element in enumerate(self.elements):
-            if i == 0:  # First element
-                dr = (self.elements[i + 1].r - element.r) / 2
-            elif i == len(self.elements) - 1:  # Last element
-                dr = (element.r - self.elements[i - 1].r) / 2
-            else:  # Middle elements
-                dr = (self.elements[i + 1].r - self.elements[i - 1].r) / 2
-            element.dr = dr
+        self.update_geometry_arrays()
+        r = self.r_arr
+        dr = np.empty_like(r)
+        dr[0] = (r[1] - r[0]) / 2  # First element
+        dr[-1] = (r[-1] - r[-2]) / 2  # Last element
+        dr[1:-1] = (r[2:] - r[:-2]) / 2  # Middle elements
+        self.dr_arr = dr
+
+        for element, element_dr in zip(self.elements, dr):
+            element.dr = element_dr
+
+    def calculate_solidity(self, operational_condition):
+        """
+        Calculate the solidity of every blade element at once.
+
+        Elements at the root (r = 0) get a solidity of 1, and the solidity
+        cannot exceed 1 for physical reasons. Uses the geometry arrays, which
+        every solve rebuilds (see update_geometry_arrays).
+
+        Parameters:
+        - operational_condition (OperationalCondition): Provides the number of blades.
+
+        Returns:
+        - np.ndarray: Solidity of each element, also stored as solidity_arr.
+        """
+        at_root = self.r_arr == 0
+        solidity = np.minimum(
+            (operational_condition.num_blades * self.chord_arr)
+            / (2 * np.pi * np.where(at_root, 1.0, self.r_arr)),
+            1.0,
+        )
+        solidity[at_root] = 1.0
+        self.solidity_arr = solidity
+        return solidity
+
+    def calculate_tip_speed_ratio(self, wind_speed, omega):
+        """
+        Calculate the tip speed ratio for one or more operating points.
+
+        Parameters:
+        - wind_speed (float or np.ndarray): Wind speed(s) in m/s.
+        - omega (float or np.ndarray): Angular velocity in rad/s.
+
+        Returns:
+        - float or np.ndarray: Tip speed ratio, zero where the wind speed is zero.
+        """
+        wind_speed = np.asarray(wind_speed, dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            tsr = np.where(
+                wind_speed == 0, 0.0, omega * self.r_arr.max() / wind_speed)
+        return tsr[()]
 
     def compute_induction_factors_blade(
         self,
@@ -91,6 +203,9 @@ class Blade:
         max_iterations=100,
         tolerance=1e-5,
         operational_condition=None,
+        dtype=np.float64,
+        accelerate=False,
+        glauert=False,
     ):
         """
         Compute induction factors for all blade elements.
@@ -100,28 +215,448 @@ class Blade:
         - a_prime_guess (float): Initial guess for tangential induction factor.
         - max_iterations (int): Maximum number of iterations for convergence.
         - tolerance (float): Convergence tolerance.
+        - dtype: Floating point type of the solver arrays. Use np.float32 when
+                 single precision is sufficient for the chosen tolerance.
+        - accelerate (bool): Use Aitken acceleration in the induction fixed
+                             point iteration.
+        - glauert (bool): Apply the Glauert correction to axial induction
+                          factors above 0.2.
 
         Returns:
         - List[BladeElement]: List of blade elements with updated induction factors.
         """
-        self.calculate_element_discretization_lengths()  # Calculate dr for each element
-
-        for element in self.elements:
-            element.calculate_solidity(
-                operational_conditions=operational_condition
-            )  # Calculate solidity for each element
-            self.R = max(element.r for element in self.elements)
-            element.compute_induction_factors(
-                a_guess=a_guess,
-                a_prime_guess=a_prime_guess,
-                max_iterations=max_iterations,
-                tolerance=tolerance,
-                operational_characteristics=self.operational_characteristics,
-                operational_condition=operational_condition,
-            )
+        table = self._prepare_solve(operational_condition)
+
+        dtype = np.dtype(dtype).type
+        wind_speed = dtype(operational_condition.wind_speed)
+        omega = dtype(operational_condition.omega)
+
+        # Initial flow angle and angle of attack for all elements at once
+        r = self.r_arr.astype(dtype, copy=False)
+        twist_rad = self.twist_rad_arr.astype(dtype, copy=False)
+        pitch_rad = dtype(operational_condition.pitch_angle(
+            self.operational_characteristics))
+        phi = np.arctan2((1 - a_guess) * wind_speed,
+                         (1 + a_prime_guess) * omega * r)
+        alpha = phi - (pitch_rad + twist_rad)
+
+        cl, cd = self._interpolate_aero_coefficients(np.degrees(alpha), table)
+        sin_phi = np.sin(phi)
+        cos_phi = np.cos(phi)
+        Cn = cl * cos_phi + cd * sin_phi
+        Ct = cl * sin_phi - cd * cos_phi
+
+        # Solve all elements with polar data simultaneously
+        solved = table["solved"]
+        a, a_prime, phi_final = induction_fixed_point(
+            a_guess,
+            a_prime_guess,
+            wind_speed,
+            omega,
+            r[solved],
+            self.solidity_arr[solved],
+            Cn[solved],
+            Ct[solved],
+            tolerance,
+            max_iterations,
+            dtype,
+            accelerate,
+            return_phi=True,
+            glauert=glauert,
+        )
+
+        self._store_solution(
+            solved, a, a_prime, phi_final,
+            alpha[solved], cl[solved], cd[solved], Cn[solved], Ct[solved])
+        return self.elements
+
+    def compute_induction_factors_sweep(
+        self,
+        a_guess=0.0,
+        a_prime_guess=0.0,
+        max_iterations=100,
+        tolerance=1e-5,
+        operational_condition=None,
+        dtype=np.float64,
+        accelerate=False,
+        glauert=False,
+    ):
+        """
+        Compute induction factors for all blade elements at many wind speeds at once.
+
+        Every wind speed is solved as in compute_induction_factors_blade, with
+        the wind speeds along the first axis of the results. The blade elements
+        are not updated.
+
+        Parameters:
+        - a_guess (float): Initial guess for axial induction factor.
+        - a_prime_guess (float): Initial guess for tangential induction factor.
+        - max_iterations (int): Maximum number of iterations for convergence.
+        - tolerance (float): Convergence tolerance.
+        - operational_condition (OperationalCondition): Operating points, with
+          wind_speed and omega as arrays of shape (W,).
+        - dtype: Floating point type of the solver arrays. np.float32 halves
+                 the memory traffic of large sweeps.
+        - accelerate (bool): Use Aitken acceleration in the induction fixed
+                             point iteration.
+        - glauert (bool): Apply the Glauert correction to axial induction
+                          factors above 0.2.
+
+        Returns:
+        - dict: Arrays "a", "a_prime", "phi" [rad], "cl" and "cd" of shape
+                (W, number of elements). Elements without polar data have no
+                induction and no lift or drag.
+        """
+        table = self._prepare_solve(operational_condition)
+
+        dtype = np.dtype(dtype).type
+        wind_speed = np.asarray(
+            operational_condition.wind_speed, dtype=dtype)[:, np.newaxis]
+        omega = np.asarray(
+            operational_condition.omega, dtype=dtype)[:, np.newaxis]
+        r = self.r_arr.astype(dtype, copy=False)
+        twist_rad = self.twist_rad_arr.astype(dtype, copy=False)
+
+        # Initial flow angle and angle of attack for every operating point
+        pitch_rad = np.reshape(operational_condition.pitch_angle(
+            self.operational_characteristics), (-1, 1)).astype(dtype, copy=False)
+        phi = np.arctan2((1 - a_guess) * wind_speed,
+                         (1 + a_prime_guess) * omega * r)
+        alpha = phi - (pitch_rad + twist_rad)
+
+        cl, cd = self._interpolate_aero_coefficients(np.degrees(alpha), table)
+        sin_phi = np.sin(phi)
+        cos_phi = np.cos(phi)
+        Cn = cl * cos_phi + cd * sin_phi
+        Ct = cl * sin_phi - cd * cos_phi
+
+        a = np.zeros(phi.shape, dtype=dtype)
+        a_prime = np.zeros(phi.shape, dtype=dtype)
+        phi_final = np.empty(phi.shape, dtype=dtype)
+        solved = table["solved"]
+        a[:, solved], a_prime[:, solved], phi_final[:, solved] = induction_fixed_point(
+            a_guess,
+            a_prime_guess,
+            wind_speed,
+            omega,
+            r[solved],
+            self.solidity_arr[solved],
+            Cn[:, solved],
+            Ct[:, solved],
+            tolerance,
+            max_iterations,
+            dtype,
+            accelerate,
+            return_phi=True,
+            glauert=glauert,
+        )
+        # Without induction the flow angle follows from the inflow alone
+        unsolved = np.ones(r.size, dtype=bool)
+        unsolved[solved] = False
+        phi_final[:, unsolved] = np.arctan2(wind_speed, omega * r[unsolved])
+
+        return {"a": a, "a_prime": a_prime, "phi": phi_final, "cl": cl, "cd": cd}
+
+    def compute_induction_factors_vectorized(
+        self,
+        a_guess=0.0,
+        a_prime_guess=0.0,
+        max_iterations=100,
+        tolerance=1e-5,
+        operational_condition=None,
+        accelerate=False,
+    ):
+        """
+        Solve the coupled BEM equations for all blade elements at once.
+
+        Unlike compute_induction_factors_blade, which fixes Cn and Ct at the
+        initial flow angle, the flow angle, angle of attack and polar lookup are
+        updated in every iteration. The stored flow angle, angle of attack and
+        coefficients are evaluated from the final induction factors.
 
+        Parameters:
+        - a_guess (float): Initial guess for axial induction factor.
+        - a_prime_guess (float): Initial guess for tangential induction factor.
+        - max_iterations (int): Maximum number of iterations for convergence.
+        - tolerance (float): Convergence tolerance on the largest change of a or a'.
+        - operational_condition (OperationalCondition): Current operating point.
+        - accelerate (bool): Replace every third iterate by its Aitken
+                             extrapolation.
+
+        Returns:
+        - List[BladeElement]: List of blade elements with updated induction factors.
+        """
+        table = self._prepare_solve(operational_condition)
+
+        wind_speed = operational_condition.wind_speed
+        omega = operational_condition.omega
+        solved = table["solved"]
+        r = self.r_arr[solved]
+        solidity = self.solidity_arr[solved]
+        twist_rad = self.twist_rad_arr[solved]
+        pitch_rad = operational_condition.pitch_angle(
+            self.operational_characteristics)
+
+        a = np.full(solved.size, a_guess, dtype=np.float64)
+        a_prime = np.full(solved.size, a_prime_guess, dtype=np.float64)
+        a_old = a_prime_old = None
+        for iteration in range(max_iterations):
+            phi, alpha, cl, cd, Cn, Ct, sin_phi, cos_phi = self._flow_state(
+                table, a, a_prime, wind_speed, omega, r, pitch_rad + twist_rad)
+
+            # A zero force coefficient divides to inf, the zero-induction limit
+            with np.errstate(divide="ignore"):
+                a_new = 1 / ((4 * sin_phi**2) / (solidity * Cn) + 1)
+                a_prime_new = 1 / ((4 * sin_phi * cos_phi) / (solidity * Ct) - 1)
+
+            converged = (
+                np.max(np.abs(a - a_new), initial=0.0) < tolerance
+                and np.max(np.abs(a_prime - a_prime_new), initial=0.0) < tolerance
+            )
+            if accelerate and not converged and iteration % 3 == 2:
+                a_new = _aitken(a_old, a, a_new)
+                a_prime_new = _aitken(a_prime_old, a_prime, a_prime_new)
+            a_old, a_prime_old = a, a_prime
+            a, a_prime = a_new, a_prime_new
+            if converged:
+                break
+
+        # Flow state of the final induction factors
+        phi, alpha, cl, cd, Cn, Ct, _, _ = self._flow_state(
+            table, a, a_prime, wind_speed, omega, r, pitch_rad + twist_rad)
+        self._store_solution(solved, a, a_prime, phi, alpha, cl, cd, Cn, Ct)
         return self.elements
 
+    def _flow_state(self, table, a, a_prime, wind_speed, omega, r, angle):
+        """
+        Evaluate the flow around the elements with polar data.
+
+        Parameters:
+        - table (dict): Polar table of the blade, from _polar_table.
+        - a, a_prime (np.ndarray): Axial and tangential induction factors.
+        - wind_speed (float): Wind speed [m/s].
+        - omega (float): Angular velocity [rad/s].
+        - r (np.ndarray): Spanwise positions [m].
+        - angle (np.ndarray): Sum of pitch and twist angles [rad].
+
+        Returns:
+        - tuple: Flow angle phi [rad], angle of attack alpha [rad], cl, cd,
+                 Cn, Ct, sin(phi) and cos(phi) of each element.
+        """
+        phi = np.arctan2((1 - a) * wind_speed, (1 + a_prime) * omega * r)
+        alpha = phi - angle
+        cl, cd = self._lookup_polars(np.degrees(alpha), table)
+
+        sin_phi = np.sin(phi)
+        cos_phi = np.cos(phi)
+        Cn = cl * cos_phi + cd * sin_phi
+        Ct = cl * sin_phi - cd * cos_phi
+        return phi, alpha, cl, cd, Cn, Ct, sin_phi, cos_phi
+
+    def _prepare_solve(self, operational_condition):
+        """
+        Compute the per-element quantities every induction solve needs.
+
+        Rebuilds the geometry arrays from the elements, sets dr_arr,
+        solidity_arr and the tip radius R, and validates the polar table.
+
+        Parameters:
+        - operational_condition (OperationalCondition): Current operating point.
+
+        Returns:
+        - dict: Polar table of the blade, for the lookups of this solve.
+        """
+        # Rebuilds the geometry arrays and calculates dr for each element
+        self.calculate_element_discretization_lengths()
+        self.calculate_solidity(operational_condition)
+        self.R = float(self.r_arr.max())
+        return self._polar_table()
+
+    def _store_solution(self, solved, a, a_prime, phi, alpha, cl, cd, Cn, Ct):
+        """
+        Store a solution on the blade arrays and on the solved blade elements.
+
+        Parameters:
+        - solved (np.ndarray): Indices of the elements with polar data.
+        - a, a_prime, phi, alpha, cl, cd, Cn, Ct (np.ndarray): Solution of the
+          solved elements, in the order of solved.
+        """
+        # Blade-level results; elements without polar data stay NaN
+        num_elements = len(self.elements)
+        self.a_arr = np.full(num_elements, np.nan, dtype=a.dtype)
+        self.a_prime_arr = np.full(num_elements, np.nan, dtype=a.dtype)
+        self.phi_arr = np.full(num_elements, np.nan, dtype=a.dtype)
+        self.Cn_arr = np.full(num_elements, np.nan, dtype=a.dtype)
+        self.Ct_arr = np.full(num_elements, np.nan, dtype=a.dtype)
+        self.a_arr[solved] = a
+        self.a_prime_arr[solved] = a_prime
+        self.phi_arr[solved] = phi
+        self.Cn_arr[solved] = Cn
+        self.Ct_arr[solved] = Ct
+
+        for element, solidity in zip(self.elements, self.solidity_arr):
+            element.solidity = solidity
+
+        for j, i in enumerate(solved):
+            element = self.elements[i]
+            element.alpha = alpha[j]
+            element.cl = cl[j]
+            element.cd = cd[j]
+            element.a = a[j]
+            element.a_prime = a_prime[j]
+            element.phi = phi[j]
+            element.Cn = Cn[j]
+            element.Ct = Ct[j]
+
+    def _polar_table(self):
+        """
+        Return the stacked polar table of the blade, rebuilding it if needed.
+
+        The polars of all distinct airfoils are concatenated into one table,
+        shifted so that the concatenated angle of attack grid is strictly
+        increasing. The table is cached and only rebuilt when an element's
+        airfoil or an airfoil's polar data has been replaced. The airfoil
+        coefficient arrays are read-only, so they cannot change in place.
+
+        Returns:
+        - dict: Stacked polar arrays and the polar index of each element
+                (-1 for elements without polar data).
+        """
+        polars = [
+            element.airfoil
+            if element.airfoil and element.airfoil.alpha_arr.size else None
+            for element in self.elements
+        ]
+        key = [
+            (id(airfoil), id(airfoil.alpha_arr)) if airfoil else None
+            for airfoil in polars
+        ]
+        table = self._polar_cache
+        if table is not None and table["key"] == key:
+            return table
+
+        # Index of each element's polar in the stacked table, -1 if it has none
+        polar_index = np.full(len(polars), -1)
+        unique = {}
+        for i, airfoil in enumerate(polars):
+            if airfoil:
+                polar_index[i] = unique.setdefault(
+                    id(airfoil), (len(unique), airfoil))[0]
+
+        table = {
+            "key": key,
+            # Keep the keyed objects alive so that their ids stay unique
+            "arrays": [airfoil.alpha_arr for airfoil in polars if airfoil],
+            "polar_index": polar_index,
+            "solved": np.flatnonzero(polar_index >= 0),
+        }
+        self._polar_cache = table
+        if not unique:
+            return table
+
+        airfoils = [airfoil for _, airfoil in unique.values()]
+        sizes = np.array([airfoil.alpha_arr.size for airfoil in airfoils])
+        alpha_table = np.concatenate([airfoil.alpha_arr for airfoil in airfoils])
+        cl_table = np.concatenate([airfoil.cl_arr for airfoil in airfoils])
+        cd_table = np.concatenate([airfoil.cd_arr for airfoil in airfoils])
+
+        # Shift each polar past the end of the previous one
+        first = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        last = first + sizes - 1
+        alpha_min = alpha_table[first]
+        alpha_max = alpha_table[last]
+        shift = np.concatenate(
+            ([0.0], np.cumsum(alpha_max - alpha_min + 1.0)[:-1])) - alpha_min
+
+        # Segment slopes; the last point of every polar starts a flat segment
+        d_alpha = np.diff(alpha_table)
+        cl_slope = np.zeros_like(alpha_table)
+        cd_slope = np.zeros_like(alpha_table)
+        np.divide(np.diff(cl_table), d_alpha, out=cl_slope[:-1], where=d_alpha != 0)
+        np.divide(np.diff(cd_table), d_alpha, out=cd_slope[:-1], where=d_alpha != 0)
+        cl_slope[last] = 0.0
+        cd_slope[last] = 0.0
+
+        # Per-element views, so that lookups need no further indexing
+        polar = polar_index[table["solved"]]
+        table.update(
+            search_table=alpha_table + np.repeat(shift, sizes),
+            alpha_table=alpha_table,
+            cl_table=cl_table,
+            cd_table=cd_table,
+            cl_slope=cl_slope,
+            cd_slope=cd_slope,
+            alpha_min=alpha_min[polar],
+            alpha_max=alpha_max[polar],
+            shift=shift[polar],
+        )
+        return table
+
+    def _interpolate_aero_coefficients(self, alpha_deg, table=None):
+        """
+        Interpolate lift and drag coefficients for all blade elements.
+
+        Elements without polar data get zero.
+
+        Parameters:
+        - alpha_deg (np.ndarray): Angle of attack of each element in degrees,
+                                  with the elements along the last axis.
+        - table (dict): Polar table already validated for this solve. When
+                        omitted it is taken from _polar_table.
+
+        Returns:
+        - tuple: (cl, cd) arrays shaped like alpha_deg.
+        """
+        dtype = np.result_type(alpha_deg, np.float32)
+        cl = np.zeros(np.shape(alpha_deg), dtype=dtype)
+        cd = np.zeros(np.shape(alpha_deg), dtype=dtype)
+
+        if table is None:
+            table = self._polar_table()
+        solved = table["solved"]
+        if solved.size:
+            cl[..., solved], cd[..., solved] = self._lookup_polars(
+                alpha_deg[..., solved], table)
+
+        return cl, cd
+
+    def _lookup_polars(self, alpha_deg, table):
+        """
+        Interpolate lift and drag coefficients for the elements with polar data.
+
+        Every element is located in the stacked polar table with a single
+        searchsorted call. The segment is always located in double
+        precision; the coefficients are evaluated in the floating point type
+        of alpha_deg, from tables cast once per type.
+
+        Parameters:
+        - alpha_deg (np.ndarray): Angle of attack in degrees of each element
+                                  with polar data, in blade order.
+        - table (dict): Polar table of the blade, from _polar_table.
+
+        Returns:
+        - tuple: (cl, cd) arrays shaped like alpha_deg.
+        """
+        alpha = np.clip(alpha_deg, table["alpha_min"], table["alpha_max"])
+        i = np.searchsorted(
+            table["search_table"], alpha + table["shift"], side="right") - 1
+
+        dtype = np.result_type(alpha_deg, np.float32)
+        values = table.setdefault("values", {})
+        if dtype not in values:
+            values[dtype] = [
+                table[name].astype(dtype, copy=False)
+                for name in ("alpha_table", "cl_table", "cd_table",
+                             "cl_slope", "cd_slope")
+            ]
+        alpha_table, cl_table, cd_table, cl_slope, cd_slope = values[dtype]
+
+        offset = alpha.astype(dtype, copy=False) - alpha_table[i]
+        return (
+            cl_table[i] + cl_slope[i] * offset,
+            cd_table[i] + cd_slope[i] * offset,
+        )
+
     def plot_blade_shape(self, scale_factor=10):
         """
         Plot the blade shape in 3D.
@@ -136,76 +671,53 @@ class Blade:
         # For coloring the blade elements
         colors = cm.viridis(np.linspace(0, 1, len(self.elements)))
 
-        for i, element in enumerate(self.elements):
-            if element.airfoil and hasattr(element.airfoil, "shape_coords"):
-                # Extract airfoil coordinates and scale by chord
-                airfoil_coords = np.array(element.airfoil.shape_coords)
-                x = airfoil_coords[:, 0] * element.chord
-                y = np.zeros_like(x)  # Initial y is zero
-                z = airfoil_coords[:, 1] * element.chord
-
-                # Apply twist (rotation around y-axis)
-                twist_rad = np.radians(element.twist)
-                x_rotated = x * np.cos(twist_rad) - z * np.sin(twist_rad)
-                z_rotated = x * np.sin(twist_rad) + z * np.cos(twist_rad)
-
-                # Position at correct radial location
-                y_final = y + element.r
-
-                # Plot the airfoil profile as a line
-                ax.plot(
-                    x_rotated,
-                    y_final,
-                    z_rotated,
-                    color=colors[i],
-                    label=f"r/R={element.r:.2f}" if i % 3 == 0 else "",
-                )
-
-                # Connect to next element if not the last one
-                if i < len(self.elements) - 1 and i % 2 == 0:
-                    next_element = self.elements[i + 1]
-                    if next_element.airfoil and hasattr(
-                            next_element.airfoil, "shape_coords"):
-                        # Calculate leading and trailing edge points for
-                        # current and next element
-                        le_current = [x_rotated[0], y_final[0], z_rotated[0]]
-                        te_current = [x_rotated[-1],
-                                      y_final[-1], z_rotated[-1]]
-
-                        next_coords = np.array(
-                            next_element.airfoil.shape_coords)
-                        next_x = next_coords[:, 0] * next_element.chord
-                        next_z = next_coords[:, 1] * next_element.chord
-                        next_twist_rad = np.radians(next_element.twist)
-                        next_x_rotated = next_x * \
-                            np.cos(next_twist_rad) - next_z * np.sin(next_twist_rad)
-                        next_z_rotated = next_x * \
-                            np.sin(next_twist_rad) + next_z * np.cos(next_twist_rad)
-
-                        le_next = [
-                            next_x_rotated[0],
-                            next_element.r,
-                            next_z_rotated[0],
-                        ]
-                        te_next = [
-                            next_x_rotated[-1],
-                            next_element.r,
-                            next_z_rotated[-1],
-                        ]
-
-                        # Draw lines between leading and trailing edges
-                        ax.plot(
-                            [le_current[0], le_next[0]],
-                            [le_current[1], le_next[1]],
-                            [le_current[2], le_next[2]],
-                            "k-",
-                        )
-                        ax.plot(
-                            [te_current[0], te_next[0]],
-                            [te_current[1], te_next[1]],
-                            [te_current[2], te_next[2]],
-                            "k-",
-                        )
+        # Airfoil outlines of the elements that have shape coordinates
+        outlines = {
+            i: np.asarray(element.airfoil.shape_coords)
+            for i, element in enumerate(self.elements)
+            if element.airfoil and hasattr(element.airfoil, "shape_coords")
+            and len(element.airfoil.shape_coords)
+        }
+
+        # Scale by chord, apply twist (rotation around y-axis) and position at
+        # the radial location for all outlines at once
+        sections = {}
+        if outlines:
+            plotted = np.fromiter(outlines, np.intp, len(outlines))
+            sizes = [len(coords) for coords in outlines.values()]
+            coords = np.concatenate(list(outlines.values()))
+            chord = np.repeat(self.chord_arr[plotted], sizes)
+            cos = np.repeat(np.cos(self.twist_rad_arr[plotted]), sizes)
+            sin = np.repeat(np.sin(self.twist_rad_arr[plotted]), sizes)
+            x = coords[:, 0] * chord
+            z = coords[:, 1] * chord
+            points = np.column_stack((
+                x * cos - z * sin,
+                np.repeat(self.r_arr[plotted], sizes),
+                x * sin + z * cos,
+            ))
+            sections = dict(zip(outlines, np.split(points, np.cumsum(sizes)[:-1])))
+
+        # All airfoil profiles as a single collection; collections do not
+        # update the data limits on every supported Matplotlib version
+        if sections:
+            ax.add_collection3d(Line3DCollection(
+                list(sections.values()), colors=colors[list(sections)]))
+            ax.auto_scale_xyz(points[:, 0], points[:, 1], points[:, 2])
+
+        # Leading and trailing edge lines from every second element to the next
+        edges = [
+            [sections[i][end], sections[i + 1][end]]
+            for i in sections if i % 2 == 0 and i + 1 in sections
+            for end in (0, -1)
+        ]
+        if edges:
+            ax.add_collection3d(Line3DCollection(edges, colors="k"))
+
+        legend_handles = [
+            Line2D([], [], color=colors[i], label=f"r/R={self.elements[i].r:.2f}")
+            for i in sections if i % 3 == 0
+        ]
 
         # Set equal aspect ratio with scale factor for better visibility
         ax.set_box_aspect([scale_factor, self.R, scale_factor])
@@ -222,6 +734,7 @@ class Blade:
 
         # Adjust legend position and alignment
         ax.legend(
+            handles=legend_handles,
             loc="upper left",
             bbox_to_anchor=(
                 1.05,
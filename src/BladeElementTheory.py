@@ -1,7 +1,27 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 from src.Blade import Blade
 from src.OperationalCondition import OperationalCondition
 
+# Blade of the current worker process, sent once per worker
+_worker_blade = None
+
+
+def _init_worker(blade):
+    """Store the blade in a worker process of compute_power_curve_parallel."""
+    global _worker_blade
+    _worker_blade = blade
+
+
+def _performance_at(operational_condition):
+    """Solve the worker's blade at one operating point and return its performance."""
+    _worker_blade.compute_induction_factors_blade(
+        operational_condition=operational_condition)
+    return BladeElementTheory(_worker_blade).compute_aerodynamic_performance(
+        operational_condition)
+
 
 class BladeElementTheory:
     def __init__(self, blade: Blade):
@@ -36,63 +56,9 @@ class BladeElementTheory:
 
         solidity = (num_blades * chord) / (2 * np.pi * r)
         # Solidity cannot exceed 1 for physical reasons
-        solidity = min(solidity, 1)
+        solidity = 1 if solidity > 1 else solidity
         return solidity
 
-    def compute_element_induction_factors(
-        self,
-        a,
-        a_prime,
-        wind_speed,
-        omega,
-        r,
-        chord,
-        phi,
-        Cn,
-        Ct,
-        tolerance=1e-5,
-        max_iterations=100,
-    ):
-        """
-        Computes the induction factors for a single blade element.
-
-        Args:
-            a (float): Initial axial induction factor.
-            a_prime (float): Initial tangential induction factor.
-            wind_speed (float): Wind speed [m/s].
-            omega (float): Rotational speed [rad/s].
-            r (float): Spanwise position [m].
-            phi (float): Flow angle [rad].
-            Cn (float): Normal force coefficient.
-            Ct (float): Tangential force coefficient.
-            tolerance (float): Convergence tolerance.
-            max_iterations (int): Maximum number of iterations.
-
-        Returns:
-            tuple: Axial and tangential induction factors (a, a_prime).
-        """
-        for _ in range(max_iterations):
-            phi = np.arctan2((1 - a) * wind_speed, (1 + a_prime) * omega * r)
-
-            solidity = self.calculate_solidity(
-                operational_conditions=None, chord=chord, r=r, solidity=None
-            )
-
-            a_new = 1 / ((4 * np.sin(phi) ** 2) / (self.solidity * Cn) + 1)
-            a_prime_new = 1 / \
-                ((4 * np.sin(phi) * np.cos(phi)) / (solidity * Ct) - 1)
-
-            if abs(
-                a -
-                a_new) < tolerance and abs(
-                a_prime -
-                    a_prime_new) < tolerance:
-                break
-
-            a, a_prime = a_new, a_prime_new
-
-        return a, a_prime
-
     def compute_induction_factors(
         self,
         radius=0.0,
@@ -125,71 +91,76 @@ class BladeElementTheory:
         omega = operational_condition.omega
         r = radius
 
-        # Find the two nearest blade elements for interpolation
-        sorted_elements = sorted(self.blade.elements, key=lambda x: x.r)
-        radii = np.array([elem.r for elem in sorted_elements])
+        # Find the two nearest blade elements for interpolation, using the
+        # radius ordering of the current element geometry
+        self.blade.update_geometry_arrays()
+        elements = self.blade.elements
+        order = self.blade.r_order_arr
+        radii = self.blade.r_sorted_arr
 
         # Find bracketing elements
         idx = np.searchsorted(radii, r)
         if idx == 0:
-            elem1 = sorted_elements[0]
-            elem2 = sorted_elements[0]
+            elem1 = elements[order[0]]
+            elem2 = elements[order[0]]
             w = 1.0
-        elif idx >= len(sorted_elements):
-            elem1 = sorted_elements[-1]
-            elem2 = sorted_elements[-1]
+        elif idx >= len(order):
+            elem1 = elements[order[-1]]
+            elem2 = elements[order[-1]]
             w = 1.0
         else:
-            elem1 = sorted_elements[idx - 1]
-            elem2 = sorted_elements[idx]
+            elem1 = elements[order[idx - 1]]
+            elem2 = elements[order[idx]]
             # Calculate interpolation weight
             w = (r - elem1.r) / (elem2.r - elem1.r)
 
         # Interpolate geometric properties
         chord = (1 - w) * elem1.chord + w * elem2.chord
-        twist_rad = np.radians((1 - w) * elem1.twist + w * elem2.twist)
+        twist_rad = math.radians((1 - w) * elem1.twist + w * elem2.twist)
 
         # Get pitch angle through interpolation
-        wind_speeds = np.array(
-            [op.wind_speed for op in operational_characteristics.characteristics]
+        pitch_rad = operational_condition.pitch_angle(
+            operational_characteristics)
+
+        # Solidity only depends on the interpolated geometry
+        solidity = self.calculate_solidity(
+            operational_conditions=operational_condition, chord=chord, r=r
         )
-        pitches = np.array([np.radians(op.pitch)
-                            for op in operational_characteristics.characteristics])
-        pitch_rad = np.interp(
-            operational_condition.wind_speed,
-            wind_speeds,
-            pitches)
-
-        # Iterative solution
+
+        # Neighbouring elements often share an airfoil, in which case one
+        # polar interpolation per iteration serves both
+        shared_airfoil = elem1 is elem2 or elem1.airfoil is elem2.airfoil
+
+        # Iterative solution on scalars, using math to avoid NumPy dispatch
         for _ in range(max_iterations):
             # Calculate flow angle
-            phi = np.arctan2((1 - a) * wind_speed, (1 + a_prime) * omega * r)
+            phi = math.atan2((1 - a) * wind_speed, (1 + a_prime) * omega * r)
 
             # Calculate angle of attack
             alpha = phi - (pitch_rad + twist_rad)
-            alpha_deg = np.degrees(alpha)
+            alpha_deg = math.degrees(alpha)
 
             # Get Cl and Cd through double interpolation
             cl1, cd1 = self._get_aero_coeffs_from_element(elem1, alpha_deg)
-            cl2, cd2 = self._get_aero_coeffs_from_element(elem2, alpha_deg)
+            if shared_airfoil:
+                cl2, cd2 = cl1, cd1
+            else:
+                cl2, cd2 = self._get_aero_coeffs_from_element(elem2, alpha_deg)
 
             # Interpolate between elements
             Cl = (1 - w) * cl1 + w * cl2
             Cd = (1 - w) * cd1 + w * cd2
 
-            # Calculate force coefficients
-            Cn = Cl * np.cos(phi) + Cd * np.sin(phi)
-            Ct = Cl * np.sin(phi) - Cd * np.cos(phi)
-
-            # Calculate solidity
-            solidity = self.calculate_solidity(
-                operational_conditions=operational_condition, chord=chord, r=r
-            )
+            # Calculate force coefficients; sin and cos of phi are shared with
+            # the induction update below
+            sin_phi = math.sin(phi)
+            cos_phi = math.cos(phi)
+            Cn = Cl * cos_phi + Cd * sin_phi
+            Ct = Cl * sin_phi - Cd * cos_phi
 
             # Update induction factors
-            a_new = 1 / ((4 * np.sin(phi) ** 2) / (solidity * Cn) + 1)
-            a_prime_new = 1 / \
-                ((4 * np.sin(phi) * np.cos(phi)) / (solidity * Ct) - 1)
+            a_new = 1 / ((4 * sin_phi ** 2) / (solidity * Cn) + 1)
+            a_prime_new = 1 / ((4 * sin_phi * cos_phi) / (solidity * Ct) - 1)
 
             # Check convergence
             if abs(
@@ -208,7 +179,7 @@ class BladeElementTheory:
             "alpha": alpha_deg,
             "cl": Cl,
             "cd": Cd,
-            "phi": np.degrees(phi),
+            "phi": math.degrees(phi),
             "Cn": Cn,
             "Ct": Ct,
         }
@@ -224,18 +195,11 @@ class BladeElementTheory:
         Returns:
             tuple: (cl, cd) Interpolated lift and drag coefficients
         """
-        if element.airfoil and element.airfoil.aero_data:
-            alphas = np.array(
-                [data.alpha for data in element.airfoil.aero_data])
-            cls = np.array([data.cl for data in element.airfoil.aero_data])
-            cds = np.array([data.cd for data in element.airfoil.aero_data])
+        if element.airfoil and element.airfoil.alpha_arr.size:
+            return element.airfoil.interp_fast(alpha)
 
-            return (
-                np.interp(alpha, alphas, cls),
-                np.interp(alpha, alphas, cds),
-            )
-
-        return 0.0, 0.0
+        # NumPy zeros keep NumPy division semantics in the induction update
+        return np.float64(0.0), np.float64(0.0)
 
     def compute_aerodynamic_performance(
             self, operational_condition: OperationalCondition):
@@ -257,9 +221,6 @@ class BladeElementTheory:
             - CT: Thrust coefficient (dimensionless).
             - CP: Power coefficient (dimensionless).
         """
-        total_thrust = 0
-        total_torque = 0
-
         # Get rotor properties
         R = self.blade.R
         A = np.pi * R**2  # Rotor area
@@ -267,47 +228,43 @@ class BladeElementTheory:
         omega = operational_condition.omega  # Rotor angular velocity
         rho = operational_condition.rho  # Air density
 
-        for element in self.blade.elements:
-            # Get element properties
-            r = element.r
-            dr = element.dr
-            alpha = element.alpha
-            phi = element.phi
-            chord = element.chord
-            Cl = element.cl
-            Cd = element.cd
-            a = element.a
-            a_prime = element.a_prime
-
-            # Calculate relative wind speed
-            V_rel = np.sqrt(((1 - a) * wind_speed) ** 2 +
-                            ((1 + a_prime) * omega * r) ** 2)
-
-            # Calculate lift and drag forces per unit length
-            L = 0.5 * rho * V_rel**2 * chord * Cl
-            D = 0.5 * rho * V_rel**2 * chord * Cd
-
-            # Project forces to normal and tangential directions
-            Fn = L * np.cos(phi) + D * np.sin(phi)
-            Ft = L * np.sin(phi) - D * np.cos(phi)
-
-            # Compute local contributions to thrust and torque
-            dT = 4 * np.pi * r * rho * wind_speed**2 * a * (1 - a) * dr
-            dM = 4 * np.pi * r**3 * rho * wind_speed * \
-                omega * a_prime * (1 - a) * dr
-
-            # Store forces in element
-            element.L = L
-            element.D = D
-            element.Fn = Fn
-            element.Ft = Ft
-            element.dT = dT
-            element.dM = dM
-            element.V_rel = V_rel
-
-            # Add to totals
-            total_thrust += dT
-            total_torque += dM
+        # Gather the per-element state and geometry in one pass
+        elements = self.blade.elements
+        r, chord, a, a_prime, phi, Cl, Cd, dr = np.fromiter(
+            (value for element in elements
+             for value in (element.r, element.chord, element.a,
+                           element.a_prime, element.phi, element.cl,
+                           element.cd, element.dr)),
+            dtype=np.float64,
+            count=8 * len(elements),
+        ).reshape(-1, 8).T
+
+        # Calculate relative wind speed
+        V_rel = np.hypot((1 - a) * wind_speed, (1 + a_prime) * omega * r)
+
+        # Calculate lift and drag forces per unit length
+        q_chord = 0.5 * rho * V_rel**2 * chord
+        L = q_chord * Cl
+        D = q_chord * Cd
+
+        # Project forces to normal and tangential directions
+        cos_phi = np.cos(phi)
+        sin_phi = np.sin(phi)
+        Fn = L * cos_phi + D * sin_phi
+        Ft = L * sin_phi - D * cos_phi
+
+        # Thrust and torque share the momentum weight 4*pi*rho*r*(1 - a)*dr
+        weight = 4 * np.pi * rho * r * (1 - a) * dr
+        dT = weight * wind_speed**2 * a
+        dM = weight * r**2 * wind_speed * omega * a_prime
+
+        # Store forces in elements
+        for element, *forces in zip(elements, L, D, Fn, Ft, dT, dM, V_rel):
+            (element.L, element.D, element.Fn, element.Ft,
+             element.dT, element.dM, element.V_rel) = forces
+
+        total_thrust = dT.sum()
+        total_torque = dM.sum()
 
         # Calculate total power
         total_power = total_torque * omega
@@ -320,3 +277,91 @@ class BladeElementTheory:
         cp = total_power / denom_P if denom_P != 0 else 0
 
         return total_thrust, total_torque, total_power, ct, cp
+
+    def compute_aerodynamic_performance_sweep(
+            self, operational_condition: OperationalCondition, dtype=np.float64,
+            glauert=False):
+        """
+        Compute the aerodynamic performance of the blade at many wind speeds at once.
+
+        The induction factors are solved for all wind speeds together with
+        Blade.compute_induction_factors_sweep, and the totals are evaluated as
+        in compute_aerodynamic_performance. The blade elements are not updated.
+
+        Parameters:
+        - operational_condition (OperationalCondition): Operating points, with
+          wind_speed and omega as arrays of shape (W,).
+        - dtype: Floating point type of the induction solve. The totals are
+          always accumulated in double precision.
+        - glauert (bool): Apply the Glauert correction to axial induction
+          factors above 0.2.
+
+        Returns:
+        - tuple: (total_thrust, total_torque, total_power, CT, CP), each an
+          array with one entry per wind speed.
+        """
+        solution = self.blade.compute_induction_factors_sweep(
+            operational_condition=operational_condition, dtype=dtype,
+            glauert=glauert)
+
+        # Get rotor properties
+        R = self.blade.R
+        A = np.pi * R**2  # Rotor area
+        wind_speed = np.asarray(operational_condition.wind_speed, dtype=np.float64)
+        omega = np.asarray(operational_condition.omega, dtype=np.float64)
+        rho = operational_condition.rho
+
+        # Elements along the last axis, wind speeds along the first
+        a = solution["a"]
+        a_prime = solution["a_prime"]
+        r = self.blade.r_arr
+        weight = 4 * np.pi * rho * r * (1 - a) * self.blade.dr_arr
+        dT = weight * wind_speed[:, np.newaxis]**2 * a
+        dM = weight * r**2 * (wind_speed * omega)[:, np.newaxis] * a_prime
+
+        total_thrust = dT.sum(axis=1)
+        total_torque = dM.sum(axis=1)
+        total_power = total_torque * omega
+
+        # Calculate coefficients, zero where there is no wind
+        denom_T = 0.5 * rho * A * wind_speed**2
+        denom_P = 0.5 * rho * A * wind_speed**3
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ct = np.where(denom_T != 0, total_thrust / denom_T, 0.0)
+            cp = np.where(denom_P != 0, total_power / denom_P, 0.0)
+
+        return total_thrust, total_torque, total_power, ct, cp
+
+    def compute_power_curve_parallel(self, operational_conditions, n_workers=None):
+        """
+        Compute the aerodynamic performance at many operating points in parallel.
+
+        Every operating point is solved in a worker process with
+        Blade.compute_induction_factors_blade followed by
+        compute_aerodynamic_performance. The blade is sent to each worker once
+        and the blade in this process is not updated.
+
+        Parameters:
+        - operational_conditions (List[OperationalCondition]): Operating points
+          with their angular velocity already calculated.
+        - n_workers (int): Number of worker processes. Default is the number of CPUs.
+
+        Returns:
+        - tuple: (total_thrust, total_torque, total_power, CT, CP), each an
+          array with one entry per operating point.
+        """
+        # Send the operating points in a few chunks per worker rather than
+        # one at a time
+        n_workers = n_workers or os.cpu_count() or 1
+        chunksize = max(1, len(operational_conditions) // (4 * n_workers))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(self.blade,),
+        ) as executor:
+            results = list(executor.map(
+                _performance_at, operational_conditions, chunksize=chunksize))
+
+        if not results:
+            return tuple(np.empty(0) for _ in range(5))
+        return tuple(np.array(values) for values in zip(*results))
@@ -1,8 +1,20 @@
+import re
 from typing import List
 from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Number patterns shared by the input file parsers. Rows start with an
+# unsigned number, so "---" divider lines never match.
+_UNSIGNED_FLOAT = r"(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_FLOAT = rf"[-+]?{_UNSIGNED_FLOAT}"
+
+# A row of exactly five numbers: wind speed, pitch, rpm, aero power and thrust.
+_ROW_RE = re.compile(
+    rf"^[ \t]*{_UNSIGNED_FLOAT}(?:[ \t]+{_FLOAT}){{4}}[ \t]*$",
+    re.MULTILINE,
+)
+
 
 class OperationalCharacteristic:
     def __init__(
@@ -38,37 +50,113 @@ class OperationalCharacteristics:
             characteristics: List[OperationalCharacteristic] = None):
         self.characteristics = characteristics if characteristics else []
 
+    @property
+    def characteristics(self) -> List[OperationalCharacteristic]:
+        """List of operating points, ordered as given."""
+        return self._characteristics
+
+    @characteristics.setter
+    def characteristics(self, characteristics: List[OperationalCharacteristic]):
+        """Set the operating points; the lookup arrays are rebuilt on next use."""
+        self._characteristics = characteristics
+        self._arrays = None
+
+    def _lookup_arrays(self):
+        """Lookup arrays of the operating points.
+
+        They are rebuilt when the list is reassigned or when operating points
+        have been appended to or removed from it.
+        """
+        characteristics = self._characteristics
+        arrays = self._arrays
+        if arrays is None or arrays["size"] != len(characteristics):
+            pitch = np.array([op.pitch for op in characteristics], dtype=np.float64)
+            rpm = np.array([op.rpm for op in characteristics], dtype=np.float64)
+            arrays = {
+                "size": len(characteristics),
+                "wind_speed": np.array(
+                    [op.wind_speed for op in characteristics], dtype=np.float64),
+                "pitch": pitch,
+                "pitch_rad": np.radians(pitch),
+                "rpm": rpm,
+                "omega": rpm * 2 * np.pi / 60,  # Convert RPM to rad/s
+            }
+            self._arrays = arrays
+        return arrays
+
+    @property
+    def wind_speed_arr(self) -> np.ndarray:
+        """Wind speeds of the operating points [m/s]."""
+        return self._lookup_arrays()["wind_speed"]
+
+    @property
+    def pitch_arr(self) -> np.ndarray:
+        """Pitch angles of the operating points [deg]."""
+        return self._lookup_arrays()["pitch"]
+
+    @property
+    def pitch_rad_arr(self) -> np.ndarray:
+        """Pitch angles of the operating points [rad]."""
+        return self._lookup_arrays()["pitch_rad"]
+
+    @property
+    def rpm_arr(self) -> np.ndarray:
+        """Rotor speeds of the operating points [rpm]."""
+        return self._lookup_arrays()["rpm"]
+
+    @property
+    def omega_arr(self) -> np.ndarray:
+        """Rotor speeds of the operating points [rad/s]."""
+        return self._lookup_arrays()["omega"]
+
+    def pitch_angle(self, wind_speed):
+        """Interpolate the blade pitch angle in radians at the given wind speed(s)."""
+        arrays = self._lookup_arrays()
+        return np.interp(wind_speed, arrays["wind_speed"], arrays["pitch_rad"])
+
+    def rotor_speed(self, wind_speed):
+        """Interpolate the rotor speed in rpm at the given wind speed(s)."""
+        arrays = self._lookup_arrays()
+        return np.interp(wind_speed, arrays["wind_speed"], arrays["rpm"])
+
+    def _closest_indices(self, wind_speed):
+        """Indices of the operating points closest to the given wind speed(s).
+
+        Ties go to the operating point listed first, as with a linear scan.
+        """
+        order = np.argsort(self.wind_speed_arr, kind="stable")
+        ws = self.wind_speed_arr[order]
+
+        # Neighbours in the sorted table, each moved to the first of equal
+        # wind speeds, which stable sorting keeps in listed order
+        right = np.minimum(np.searchsorted(ws, wind_speed), ws.size - 1)
+        left = np.searchsorted(ws, ws[np.maximum(right - 1, 0)])
+        right = np.searchsorted(ws, ws[right])
+
+        d_left = np.abs(ws[left] - wind_speed)
+        d_right = np.abs(ws[right] - wind_speed)
+        take_left = (d_left < d_right) | (
+            (d_left == d_right) & (order[left] < order[right]))
+        return order[np.where(take_left, left, right)]
+
     def load_from_file(self, file_path: Path):
-        lines = file_path.read_text(encoding="utf-8").splitlines()
-        self.characteristics = []
-
-        for line in lines:
-            line = line.strip()
-            if not line or any(line.startswith(c)
-                               for c in ("-", "=", "!", "#")):
-                continue
-
-            parts = line.split()
-            if len(parts) != 5:
-                continue  # skip malformed lines
-
-            try:
-                wind_speed = float(parts[0])
-                pitch = float(parts[1])
-                rpm = float(parts[2])
-                aero_power = float(parts[3])
-                aero_thrust = float(parts[4])
-
-                condition = OperationalCharacteristic(
-                    wind_speed=wind_speed,
-                    pitch=pitch,
-                    rpm=rpm,
-                    aero_power=aero_power,
-                    aero_thrust=aero_thrust,
-                )
-                self.characteristics.append(condition)
-            except ValueError:
-                continue
+        # Select the well-formed rows in one regex pass, then parse them in bulk
+        rows = _ROW_RE.findall(file_path.read_text(encoding="utf-8"))
+        if not rows:
+            self.characteristics = []
+            return
+
+        table = np.loadtxt(rows, ndmin=2)
+        self.characteristics = [
+            OperationalCharacteristic(
+                wind_speed=wind_speed,
+                pitch=pitch,
+                rpm=rpm,
+                aero_power=aero_power,
+                aero_thrust=aero_thrust,
+            )
+            for wind_speed, pitch, rpm, aero_power, aero_thrust in table.tolist()
+        ]
 
     def plot_characteristics(
             self,
@@ -79,17 +167,11 @@ class OperationalCharacteristics:
         and rotational speed omega, as function of wind speed V_0, based on
         the provided operational strategy"""
         V = np.linspace(V_min, V_max, num_points)
-        theta_p = np.zeros(num_points)
-        omega = np.zeros(num_points)
-
-        for i, wind_speed in enumerate(V):
-            # Find the closest operational characteristic
-            closest_condition = min(
-                self.characteristics,
-                key=lambda x: abs(x.wind_speed - wind_speed),
-            )
-            theta_p[i] = closest_condition.pitch
-            omega[i] = closest_condition.omega
+
+        # Closest operational characteristic for every wind speed at once
+        closest = self._closest_indices(V)
+        theta_p = self.pitch_arr[closest]
+        omega = self.omega_arr[closest]
 
         plt.figure(figsize=(10, 6))
         plt.plot(V, theta_p, label="Pitch Angle (degrees)", color="blue")
@@ -19,41 +19,57 @@ class OperationalCondition:
         - num_blades (int): Number of blades. Default is 3.
         - rpm (float): Rotations per minute. Default is None.
         - omega (float): Angular velocity in rad/s. Default is None.
+        - pitch_rad (float): Blade pitch angle in radians. Default is None.
         """
         self.wind_speed = wind_speed
         self.rho = rho
         self.num_blades = num_blades
         self.rpm = None  # Placeholder for RPM, to be set by given blade
         self.omega = None  # Placeholder for angular velocity, to be set by given blade
+        self.pitch_rad = None  # Placeholder for pitch angle, to be set by given blade
+        self._pitch_key = None  # Pitch table and wind speed pitch_rad belongs to
 
     def calculate_angular_velocity(self, blade: Blade):
         """
         Calculate the angular velocity in rad/s from RPM.
 
+        The pitch angle of the same operating point is interpolated alongside,
+        so that solvers do not interpolate it again for every radius.
+
         Parameters:
         - blade (Blade): Blade object containing operational characteristics.
 
         Returns:
-        - self: The OperationalCondition object with updated rpm and omega.
+        - self: The OperationalCondition object with updated rpm, omega and pitch_rad.
         """
-        # Interpolate pitch angle based on wind speed
-        wind_speeds = np.array(
-            [
-                blade.operational_characteristics.characteristics[i].wind_speed
-                for i in range(len(blade.operational_characteristics.characteristics))
-            ]
-        )
-        rpms = np.array(
-            [
-                blade.operational_characteristics.characteristics[i].rpm
-                for i in range(len(blade.operational_characteristics.characteristics))
-            ]
-        )
-
-        self.rpm = np.interp(self.wind_speed, wind_speeds, rpms)
+        # Interpolate the rotor speed and pitch angle based on wind speed
+        self.rpm = blade.operational_characteristics.rotor_speed(self.wind_speed)
         self.omega = self.rpm * 2 * np.pi / 60
+        self.pitch_angle(blade.operational_characteristics)
         return self
 
+    def pitch_angle(self, operational_characteristics):
+        """
+        Return the pitch angle in radians of this operating point.
+
+        The interpolated angle is kept in pitch_rad and reused as long as the
+        wind speed and the pitch table of the characteristics are unchanged.
+
+        Parameters:
+        - operational_characteristics (OperationalCharacteristics): Used to
+          interpolate the pitch angle at the wind speed.
+
+        Returns:
+        - float: Pitch angle in radians.
+        """
+        pitch_table = operational_characteristics.pitch_rad_arr
+        key = self._pitch_key
+        if (key is None or key[0] is not pitch_table
+                or not np.array_equal(key[1], self.wind_speed)):
+            self.pitch_rad = operational_characteristics.pitch_angle(self.wind_speed)
+            self._pitch_key = (pitch_table, np.copy(self.wind_speed))
+        return self.pitch_rad
+
     def __repr__(self):
         return (
             f"OperationalCondition(wind_speed={self.wind_speed},\n"
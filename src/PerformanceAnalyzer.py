@@ -41,45 +41,103 @@ class PerformanceAnalyzer:
         if not self._performance_calculated:
             self.calculate_performance()
 
-    def calculate_performance(self):
+    def calculate_performance(self, vectorized=False, parallel=False, n_workers=None):
         """
         Calculate performance metrics for the blade at different wind speeds and store them.
 
+        Parameters:
+        - vectorized (bool): Solve all wind speeds at once with
+          BladeElementTheory.compute_aerodynamic_performance_sweep instead of
+          one after another. The blade elements are then left unchanged.
+        - parallel (bool): Solve the wind speeds in worker processes with
+          BladeElementTheory.compute_power_curve_parallel. The blade elements
+          are then left unchanged. Ignored if vectorized is set.
+        - n_workers (int): Number of worker processes when parallel is set.
+          Default is the number of CPUs.
+
         Returns:
         - A dictionary containing performance metrics (e.g., power, thrust, etc.)
         """
         # Initialize or clear previous results
+        num_points = len(self.wind_speeds)
         self._performance_metrics = {
-            "wind_speed": [],
-            "power": [],
-            "thrust": [],
-            "torque": [],
-            "ct": [],
-            "cp": [],
+            "wind_speed": self.wind_speeds,
+            "power": np.zeros(num_points),
+            "thrust": np.zeros(num_points),
+            "torque": np.zeros(num_points),
+            "ct": np.zeros(num_points),
+            "cp": np.zeros(num_points),
         }
 
-        for wind_speed in self.wind_speeds:
-            operational_condition = OperationalCondition(
-                wind_speed=wind_speed, rho=self.rho, num_blades=self.num_blades
-            )
-            operational_condition.calculate_angular_velocity(blade=self.blade)
-            BET = BladeElementTheory(blade=self.blade)
+        # The blade geometry does not change across the sweep
+        BET = BladeElementTheory(blade=self.blade)
+
+        # Interpolate the rotor speed and pitch of all wind speeds at once
+        sweep_condition = OperationalCondition(
+            wind_speed=self.wind_speeds, rho=self.rho, num_blades=self.num_blades
+        )
+        sweep_condition.calculate_angular_velocity(blade=self.blade)
+
+        if vectorized or parallel:
+            if vectorized:
+                results = BET.compute_aerodynamic_performance_sweep(
+                    operational_condition=sweep_condition)
+            else:
+                results = BET.compute_power_curve_parallel(
+                    [self._operating_point(sweep_condition, i)
+                     for i in range(num_points)],
+                    n_workers=n_workers,
+                )
+            thrust, torque, power, ct, cp = results
+
+            self._performance_metrics["power"][:] = power
+            self._performance_metrics["thrust"][:] = thrust
+            self._performance_metrics["torque"][:] = torque
+            self._performance_metrics["ct"][:] = ct
+            self._performance_metrics["cp"][:] = cp
+            self._performance_calculated = True
+            return self._performance_metrics
+
+        for i in range(num_points):
+            operational_condition = self._operating_point(sweep_condition, i)
+
+            # Solve the induction factors for this wind speed
+            self.blade.compute_induction_factors_blade(
+                operational_condition=operational_condition)
 
             # Calculate performance metrics using BladeElementTheory
             thrust, torque, power, ct, cp = BET.compute_aerodynamic_performance(
                 operational_condition=operational_condition)
 
-            # Append results directly to the instance variable
-            self._performance_metrics["wind_speed"].append(wind_speed)
-            self._performance_metrics["power"].append(power)
-            self._performance_metrics["thrust"].append(thrust)
-            self._performance_metrics["torque"].append(torque)
-            self._performance_metrics["ct"].append(ct)
-            self._performance_metrics["cp"].append(cp)
+            # Store results directly in the instance variable
+            self._performance_metrics["power"][i] = power
+            self._performance_metrics["thrust"][i] = thrust
+            self._performance_metrics["torque"][i] = torque
+            self._performance_metrics["ct"][i] = ct
+            self._performance_metrics["cp"][i] = cp
 
         self._performance_calculated = True  # Mark as calculated
         return self._performance_metrics
 
+    def _operating_point(self, sweep_condition, i):
+        """
+        Operating condition of the i-th wind speed of the sweep.
+
+        Parameters:
+        - sweep_condition (OperationalCondition): Condition holding all wind
+          speeds, with its angular velocity already calculated.
+        - i (int): Index of the wind speed.
+
+        Returns:
+        - OperationalCondition: Condition at the i-th wind speed.
+        """
+        operational_condition = OperationalCondition(
+            wind_speed=self.wind_speeds[i], rho=self.rho, num_blades=self.num_blades
+        )
+        operational_condition.rpm = sweep_condition.rpm[i]
+        operational_condition.omega = sweep_condition.omega[i]
+        return operational_condition
+
     @property
     def performance_metrics(self):
         """
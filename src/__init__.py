@@ -1,5 +1,6 @@
 """Source code for small functions used in the project."""
 
+import numpy as np
 import matplotlib.pyplot as plt
 
 
@@ -16,20 +17,44 @@ def save_results(operational_condition, results, output_file, input_folder):
 
     # Ensure the directory exists
     output_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_file, "w") as f:
-
-        f.write("=== Wind Turbine Simulation Results ===\n")
-        f.write(f"\nData Source: {input_folder}\n")
-        f.write("\n=== Operational Conditions ===\n")
-        f.write(f"Wind Speed: {operational_condition.wind_speed:.2f} m/s\n")
-        f.write(f"Air Density: {operational_condition.rho:.2f} kg/m^3\n")
-        f.write(f"Number of Blades: {operational_condition.num_blades}\n")
-        f.write("\n=== Results ===\n")
-        f.write(f"Total Thrust: {thrust:.2f} N\n")
-        f.write(f"Total Torque: {torque:.2f} Nm\n")
-        f.write(f"Total Power: {power:.2f} W\n")
-        f.write(f"Thrust Coefficient (CT): {ct:.4f}\n")
-        f.write(f"Power Coefficient (CP): {cp:.4f}\n")
+    output_file.write_text(
+        "=== Wind Turbine Simulation Results ===\n"
+        f"\nData Source: {input_folder}\n"
+        "\n=== Operational Conditions ===\n"
+        f"Wind Speed: {operational_condition.wind_speed:.2f} m/s\n"
+        f"Air Density: {operational_condition.rho:.2f} kg/m^3\n"
+        f"Number of Blades: {operational_condition.num_blades}\n"
+        "\n=== Results ===\n"
+        f"Total Thrust: {thrust:.2f} N\n"
+        f"Total Torque: {torque:.2f} Nm\n"
+        f"Total Power: {power:.2f} W\n"
+        f"Thrust Coefficient (CT): {ct:.4f}\n"
+        f"Power Coefficient (CP): {cp:.4f}\n"
+    )
+
+
+def save_performance_curves(output_folder, performance_analyzer):
+    """
+    Save the wind speed sweep as a text table and a compressed .npz archive.
+
+    Parameters:
+        output_folder (Path): Directory to save the files
+        performance_analyzer (PerformanceAnalyzer): Performance analyzer object
+    """
+    output_folder.mkdir(parents=True, exist_ok=True)
+
+    metrics = performance_analyzer.performance_metrics
+    columns = ("wind_speed", "thrust", "torque", "power", "ct", "cp")
+    np.savetxt(
+        output_folder / "performance_curves.txt",
+        np.column_stack([metrics[key] for key in columns]),
+        fmt="%.6g",
+        header=" ".join(columns),
+    )
+    np.savez_compressed(
+        output_folder / "performance_curves.npz",
+        **{key: metrics[key] for key in columns},
+    )
 
 
 def save_plots(output_folder, performance_analyzer):
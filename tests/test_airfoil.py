@@ -1,7 +1,15 @@
-from src.Airfoil import Airfoil, AeroCoefficients, plot_airfoil_shapes
+from src.Airfoil import (
+    AIRFOIL_CACHE_VERSION,
+    Airfoil,
+    AeroCoefficients,
+    load_airfoil_cache,
+    plot_airfoil_shapes,
+    save_airfoil_cache,
+)
 import sys
 from pathlib import Path
 import pytest
+import numpy as np
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -69,6 +77,19 @@ def test_load_from_file(tmp_path):
     assert airfoil.name == "Airfoil 01"
     assert airfoil.ref_coord == (0.25, 0.0)
     assert len(airfoil.shape_coords) == 3
+    np.testing.assert_array_equal(
+        airfoil.shape_coords, [[0.0, 0.0], [0.5, 0.1], [1.0, 0.0]])
+
+
+def test_load_from_file_name_number(tmp_path):
+    """Test that only the airfoil number is taken from the file name."""
+    coord_file = tmp_path / "IEA-15-240-RWT_AF07_Coords.txt"
+    coord_file.write_text("0 NumCoords\n")
+
+    airfoil = Airfoil(name="", reynolds=0, control=0, incl_ua_data=False)
+    airfoil.load_from_file(coord_file)
+
+    assert airfoil.name == "Airfoil 07"
 
 
 def test_load_from_polar_and_coords(tmp_path):
@@ -106,3 +127,132 @@ def test_load_from_polar_and_coords(tmp_path):
     assert len(airfoil.aero_data) == 2
     assert airfoil.aero_data[0].alpha == 0
     assert airfoil.aero_data[1].cl == 0.7
+
+
+def test_aero_data_arrays(sample_airfoil):
+    """Test that aero_data is stored as coefficient arrays."""
+    np.testing.assert_array_equal(sample_airfoil.alpha_arr, [0.0, 5.0])
+    np.testing.assert_array_equal(sample_airfoil.cl_arr, [0.5, 0.7])
+    np.testing.assert_array_equal(sample_airfoil.cd_arr, [0.01, 0.02])
+    np.testing.assert_array_equal(sample_airfoil.cm_arr, [0.02, 0.03])
+    assert sample_airfoil.aero_data[1].cl == 0.7
+
+
+def test_aero_data_records(sample_airfoil):
+    """Test that aero_data rows are records that can be assigned back."""
+    records = sample_airfoil.aero_data
+    assert isinstance(records, np.recarray)
+    assert records.dtype.names == ("alpha", "cl", "cd", "cm")
+    assert records[1].cd == 0.02
+
+    records = records.copy()
+    records.cl *= 2
+    sample_airfoil.aero_data = records
+    np.testing.assert_array_equal(sample_airfoil.cl_arr, [1.0, 1.4])
+
+
+def test_aero_data_read_only(sample_airfoil):
+    """Test that the polar can only be changed by assigning a new table."""
+    assert sample_airfoil.aero_data is sample_airfoil.aero_data
+    assert sample_airfoil.aero_data
+    assert not Airfoil(name="", reynolds=0, control=0, incl_ua_data=False).aero_data
+    for array in (sample_airfoil.alpha_arr, sample_airfoil.cl_arr,
+                  sample_airfoil.cd_arr, sample_airfoil.cm_arr):
+        assert array.flags.c_contiguous
+
+    with pytest.raises(ValueError):
+        sample_airfoil.aero_data[1].cl = 0.9
+    with pytest.raises(ValueError):
+        sample_airfoil.cl_arr[1] = 0.9
+    np.testing.assert_array_equal(sample_airfoil.cl_arr, [0.5, 0.7])
+
+
+def test_aero_table(sample_airfoil):
+    """Test that aero_table is an (N, 4) view of the coefficient arrays."""
+    table = sample_airfoil.aero_table
+    assert table.shape == (2, 4)
+    np.testing.assert_array_equal(table[1], [5.0, 0.7, 0.02, 0.03])
+    assert np.shares_memory(table, sample_airfoil.cl_arr)
+
+
+def test_interp(sample_airfoil):
+    """Test vectorized interpolation of lift and drag coefficients."""
+    cl, cd = sample_airfoil.interp(np.array([0.0, 2.5, 5.0]))
+    np.testing.assert_allclose(cl, [0.5, 0.6, 0.7])
+    np.testing.assert_allclose(cd, [0.01, 0.015, 0.02])
+
+
+def test_coefficient_lookups(sample_airfoil):
+    """Test the single-coefficient lookups on the coefficient arrays."""
+    alpha = np.array([0.0, 2.5, 5.0])
+    np.testing.assert_allclose(sample_airfoil.cl_at(alpha), [0.5, 0.6, 0.7])
+    np.testing.assert_allclose(sample_airfoil.cd_at(alpha), [0.01, 0.015, 0.02])
+    np.testing.assert_allclose(sample_airfoil.cm_at(alpha), [0.02, 0.025, 0.03])
+    assert sample_airfoil.cl_at(2.5) == pytest.approx(0.6)
+
+
+def test_interp_fast(sample_airfoil):
+    """Test that secant interpolation matches np.interp, including clamping."""
+    alpha = np.array([-10.0, 0.0, 1.3, 2.5, 5.0, 20.0])
+    cl, cd = sample_airfoil.interp_fast(alpha)
+    cl_ref, cd_ref = sample_airfoil.interp(alpha)
+    np.testing.assert_allclose(cl, cl_ref)
+    np.testing.assert_allclose(cd, cd_ref)
+
+    cl, cd = sample_airfoil.interp_fast(2.5)
+    assert cl == pytest.approx(0.6)
+    assert cd == pytest.approx(0.015)
+
+    # The secants are recomputed whenever a new table is assigned
+    sample_airfoil.aero_data = [
+        AeroCoefficients(alpha=0, cl=0.0, cd=0.0, cm=0.0),
+        AeroCoefficients(alpha=10, cl=1.0, cd=0.1, cm=0.0),
+    ]
+    cl, cd = sample_airfoil.interp_fast(2.5)
+    assert cl == pytest.approx(0.25)
+    assert cd == pytest.approx(0.025)
+
+
+def test_airfoil_cache_roundtrip(sample_airfoil, tmp_path):
+    """Test that airfoils survive a save/load cycle through the .npz cache."""
+    cache_file = tmp_path / "airfoils.npz"
+    save_airfoil_cache(cache_file, {3: sample_airfoil})
+
+    loaded = load_airfoil_cache(cache_file)
+
+    assert list(loaded) == [3]
+    airfoil = loaded[3]
+    assert airfoil.name == "TestFoil"
+    assert airfoil.reynolds == 1e6
+    assert airfoil.control == 1
+    assert airfoil.incl_ua_data is True
+    assert airfoil.ref_coord == (0.25, 0.0)
+    np.testing.assert_array_equal(airfoil.shape_coords, sample_airfoil.shape_coords)
+    np.testing.assert_array_equal(airfoil.alpha_arr, sample_airfoil.alpha_arr)
+    np.testing.assert_array_equal(airfoil.cl_arr, sample_airfoil.cl_arr)
+    np.testing.assert_array_equal(airfoil.cd_arr, sample_airfoil.cd_arr)
+    np.testing.assert_array_equal(airfoil.cm_arr, sample_airfoil.cm_arr)
+
+
+def test_airfoil_cache_rejects_stale_archives(sample_airfoil, tmp_path, monkeypatch):
+    """Test that archives of other sources or cache versions are not reused."""
+    cache_file = tmp_path / "airfoils.npz"
+    save_airfoil_cache(cache_file, {0: sample_airfoil}, ["AF00.txt", "AF01.txt"])
+
+    assert list(load_airfoil_cache(cache_file, ["AF00.txt", "AF01.txt"])) == [0]
+    assert load_airfoil_cache(cache_file, ["AF00.txt"]) is None
+
+    monkeypatch.setattr(
+        "src.Airfoil.AIRFOIL_CACHE_VERSION", AIRFOIL_CACHE_VERSION + 1)
+    assert load_airfoil_cache(cache_file) is None
+
+
+def test_airfoil_cache_rejects_corrupt_archives(sample_airfoil, tmp_path):
+    """Test that unreadable archives are reported as missing, not raised."""
+    cache_file = tmp_path / "airfoils.npz"
+    save_airfoil_cache(cache_file, {0: sample_airfoil})
+    archive = cache_file.read_bytes()
+
+    for content in (b"", b"not an archive" * 8, archive[: len(archive) // 2]):
+        cache_file.write_bytes(content)
+        assert load_airfoil_cache(cache_file) is None
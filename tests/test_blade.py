@@ -3,9 +3,10 @@ from src.OperationalCharacteristics import (
     OperationalCharacteristic,
 )
 from src.OperationalCondition import OperationalCondition
-from src.Airfoil import Airfoil, AeroCoefficients
+from src.Airfoil import AERO_DTYPE, Airfoil, AeroCoefficients
 from src.BladeElement import BladeElement
 from src.Blade import Blade
+from src.BladeElementTheory import BladeElementTheory
 import sys
 from pathlib import Path
 import pytest
@@ -124,6 +125,26 @@ def test_blade_initialization(
     assert blade.operational_characteristics == sample_operational_characteristics
 
 
+def test_element_arrays(sample_blade_elements):
+    """Test that element geometry is mirrored in contiguous arrays."""
+    blade = Blade(elements=sample_blade_elements)
+
+    np.testing.assert_array_equal(blade.r_arr, [2.0, 4.0, 6.0])
+    np.testing.assert_array_equal(blade.chord_arr, [0.8, 0.6, 0.4])
+    np.testing.assert_array_equal(blade.twist_arr, [15.0, 10.0, 5.0])
+    np.testing.assert_allclose(blade.twist_rad_arr, np.radians([15.0, 10.0, 5.0]))
+    np.testing.assert_array_equal(blade.airfoil_id_arr, [0, 0, 0])
+
+    # Assigning new elements rebuilds the arrays
+    blade.elements = sample_blade_elements[:1]
+    np.testing.assert_array_equal(blade.r_arr, [2.0])
+
+    # The radius ordering is cached for unsorted elements
+    blade.elements = sample_blade_elements[::-1]
+    np.testing.assert_array_equal(blade.r_order_arr, [2, 1, 0])
+    np.testing.assert_array_equal(blade.r_sorted_arr, [2.0, 4.0, 6.0])
+
+
 def test_load_from_file():
     """Test loading blade data from a file."""
     # Create a temporary file with sample blade data
@@ -161,6 +182,7 @@ def test_load_from_file():
 
     # Check that elements were loaded
     assert len(blade.elements) > 0
+    np.testing.assert_array_equal(blade.r_arr, [2.0, 4.0, 6.0])
     # Check properties of loaded elements
     for element in blade.elements:
         assert isinstance(element, BladeElement)
@@ -183,6 +205,8 @@ def test_calculate_element_discretization_lengths(sample_blade):
         blade.elements[2].r - blade.elements[0].r) / 2
     assert blade.elements[2].dr == (
         blade.elements[2].r - blade.elements[1].r) / 2
+    np.testing.assert_array_equal(
+        blade.dr_arr, [element.dr for element in blade.elements])
 
 
 def test_calculate_element_discretization_lengths_empty_blade():
@@ -223,6 +247,314 @@ def test_compute_induction_factors_blade(
         assert hasattr(element, "phi")
 
 
+def test_solve_follows_element_edits(
+        sample_blade_with_airfoils,
+        sample_operational_condition,
+        sample_airfoil):
+    """Test that a solve uses the current geometry of edited elements."""
+    blade = sample_blade_with_airfoils
+    for element in blade.elements:
+        element.chord = 1.0
+    blade.elements.append(BladeElement(
+        r=8.0, twist=0.0, chord=1.0, airfoil_id=0, airfoil=sample_airfoil))
+
+    blade.compute_induction_factors_blade(
+        operational_condition=sample_operational_condition)
+
+    np.testing.assert_array_equal(blade.chord_arr, [1.0, 1.0, 1.0, 1.0])
+    np.testing.assert_array_equal(blade.r_arr, [2.0, 4.0, 6.0, 8.0])
+    assert blade.R == 8.0
+    np.testing.assert_allclose(
+        blade.solidity_arr, 3 / (2 * np.pi * blade.r_arr))
+
+
+def test_compute_induction_factors_blade_arrays(
+        sample_blade_with_airfoils,
+        sample_operational_condition):
+    """Test that the blade-level solver arrays mirror the element results."""
+    blade = sample_blade_with_airfoils
+    blade.elements[0].airfoil = None
+    blade.compute_induction_factors_blade(
+        operational_condition=sample_operational_condition
+    )
+
+    expected_solidity = 3 * blade.chord_arr / (2 * np.pi * blade.r_arr)
+    np.testing.assert_allclose(blade.solidity_arr, expected_solidity)
+    np.testing.assert_allclose(
+        blade.solidity_arr, [element.solidity for element in blade.elements])
+
+    # The element without an airfoil is not solved
+    assert np.isnan(blade.a_arr[0])
+    np.testing.assert_array_equal(
+        blade.a_arr[1:], [element.a for element in blade.elements[1:]])
+    np.testing.assert_array_equal(
+        blade.phi_arr[1:], [element.phi for element in blade.elements[1:]])
+    np.testing.assert_array_equal(
+        blade.Cn_arr[1:], [element.Cn for element in blade.elements[1:]])
+    np.testing.assert_array_equal(
+        blade.Ct_arr[1:], [element.Ct for element in blade.elements[1:]])
+
+
+def test_compute_induction_factors_vectorized(
+        sample_blade_with_airfoils,
+        sample_operational_condition):
+    """Test the coupled vectorized solver against the per-radius BET solver."""
+    blade = sample_blade_with_airfoils
+    blade.compute_induction_factors_vectorized(
+        tolerance=1e-8,
+        operational_condition=sample_operational_condition,
+    )
+
+    bet = BladeElementTheory(blade=blade)
+    for element in blade.elements:
+        reference = bet.compute_induction_factors(
+            radius=element.r,
+            tolerance=1e-8,
+            operational_characteristics=blade.operational_characteristics,
+            operational_condition=sample_operational_condition,
+        )
+        assert element.a == pytest.approx(reference["a"], abs=1e-6)
+        assert element.a_prime == pytest.approx(reference["a_prime"], abs=1e-6)
+        assert np.degrees(element.phi) == pytest.approx(reference["phi"], abs=1e-4)
+
+    np.testing.assert_array_equal(
+        blade.a_arr, [element.a for element in blade.elements])
+
+
+def test_compute_induction_factors_vectorized_state(
+        sample_blade_with_airfoils,
+        sample_operational_condition,
+        sample_airfoil):
+    """Test that the stored coupled state follows from the final induction."""
+    blade = sample_blade_with_airfoils
+    condition = sample_operational_condition
+    pitch_rad = condition.pitch_angle(blade.operational_characteristics)
+
+    for max_iterations in (0, 3):
+        blade.compute_induction_factors_vectorized(
+            max_iterations=max_iterations, operational_condition=condition)
+        for element in blade.elements:
+            phi = np.arctan2((1 - element.a) * condition.wind_speed,
+                             (1 + element.a_prime) * condition.omega * element.r)
+            alpha = phi - (pitch_rad + np.radians(element.twist))
+            cl, cd = sample_airfoil.interp(np.degrees(alpha))
+            assert element.phi == pytest.approx(phi)
+            assert element.alpha == pytest.approx(alpha)
+            assert element.cl == pytest.approx(cl)
+            assert element.Cn == pytest.approx(cl * np.cos(phi) + cd * np.sin(phi))
+
+    # Without iterations the initial guess is kept
+    blade.compute_induction_factors_vectorized(
+        a_guess=0.1, max_iterations=0, operational_condition=condition)
+    np.testing.assert_array_equal(blade.a_arr, 0.1)
+
+
+def test_compute_induction_factors_vectorized_aitken(
+        sample_blade_with_airfoils,
+        sample_operational_condition):
+    """Test that Aitken acceleration converges to the same coupled solution."""
+    blade = sample_blade_with_airfoils
+    blade.compute_induction_factors_vectorized(
+        tolerance=1e-10,
+        operational_condition=sample_operational_condition,
+    )
+    a_plain = blade.a_arr.copy()
+
+    blade.compute_induction_factors_vectorized(
+        tolerance=1e-10,
+        operational_condition=sample_operational_condition,
+        accelerate=True,
+    )
+    np.testing.assert_allclose(blade.a_arr, a_plain, atol=1e-8)
+
+
+def test_compute_induction_factors_blade_float32(
+        sample_blade_with_airfoils,
+        sample_operational_condition):
+    """Test that single precision agrees with double precision."""
+    blade = sample_blade_with_airfoils
+    blade.compute_induction_factors_blade(
+        operational_condition=sample_operational_condition
+    )
+    a_64 = np.array([element.a for element in blade.elements])
+
+    blade.compute_induction_factors_blade(
+        operational_condition=sample_operational_condition,
+        dtype=np.float32,
+    )
+    a_32 = np.array([element.a for element in blade.elements])
+    cl_32 = np.array([element.cl for element in blade.elements])
+
+    assert a_32.dtype == np.float32
+    assert cl_32.dtype == np.float32
+    np.testing.assert_allclose(a_32, a_64, atol=1e-4)
+
+
+def test_compute_induction_factors_sweep_phi(sample_blade, sample_airfoil):
+    """Test the swept flow angles, including an element without polar data."""
+    blade = sample_blade
+    blade.elements[0].airfoil = sample_airfoil
+    blade.elements[2].airfoil = sample_airfoil
+    condition = OperationalCondition(wind_speed=np.array([5.0, 10.0]))
+    condition.calculate_angular_velocity(blade)
+
+    solution = blade.compute_induction_factors_sweep(
+        operational_condition=condition)
+
+    wind_speed = condition.wind_speed[:, np.newaxis]
+    omega = condition.omega[:, np.newaxis]
+    expected = np.arctan2((1 - solution["a"]) * wind_speed,
+                          (1 + solution["a_prime"]) * omega * blade.r_arr)
+    np.testing.assert_array_equal(solution["phi"], expected)
+    np.testing.assert_array_equal(solution["a"][:, 1], 0.0)
+
+
+def test_compute_induction_factors_sweep_glauert(sample_blade_with_airfoils):
+    """Test that the sweep applies the Glauert correction like a single solve."""
+    blade = sample_blade_with_airfoils
+    for element in blade.elements:
+        element.chord *= 20.0  # Heavily loaded, so that a exceeds 0.2
+    wind_speeds = np.array([5.0, 10.0])
+    condition = OperationalCondition(wind_speed=wind_speeds)
+    condition.calculate_angular_velocity(blade)
+
+    plain = blade.compute_induction_factors_sweep(operational_condition=condition)
+    solution = blade.compute_induction_factors_sweep(
+        operational_condition=condition, glauert=True)
+    assert np.max(plain["a"]) > 0.2
+    assert not np.allclose(solution["a"], plain["a"])
+
+    for i, wind_speed in enumerate(wind_speeds):
+        single = OperationalCondition(wind_speed=wind_speed)
+        single.calculate_angular_velocity(blade)
+        blade.compute_induction_factors_blade(
+            operational_condition=single, glauert=True)
+        np.testing.assert_allclose(solution["a"][i], blade.a_arr, rtol=1e-12)
+
+
+def test_calculate_solidity():
+    """Test the blade solidity at the root, in the span and when clamped."""
+    blade = Blade(elements=[
+        BladeElement(r=0.0, twist=0.0, chord=1.0, airfoil_id=1),
+        BladeElement(r=0.1, twist=0.0, chord=1.0, airfoil_id=1),
+        BladeElement(r=6.0, twist=0.0, chord=0.4, airfoil_id=1),
+    ])
+    condition = OperationalCondition(wind_speed=10.0, num_blades=3)
+
+    solidity = blade.calculate_solidity(condition)
+
+    np.testing.assert_allclose(solidity, [1.0, 1.0, 1.2 / (12 * np.pi)])
+    assert blade.solidity_arr is solidity
+
+
+def test_calculate_tip_speed_ratio(sample_blade):
+    """Test scalar and vectorized tip speed ratio calculation."""
+    assert sample_blade.calculate_tip_speed_ratio(10.0, 0.8) == pytest.approx(0.48)
+
+    tsr = sample_blade.calculate_tip_speed_ratio(
+        np.array([0.0, 4.0, 8.0]), np.array([0.5, 0.8, 0.8]))
+    np.testing.assert_allclose(tsr, [0.0, 1.2, 0.6])
+
+    # A scalar angular velocity broadcasts over a wind speed sweep
+    tsr = sample_blade.calculate_tip_speed_ratio(np.linspace(0.0, 12.0, 4), 0.8)
+    np.testing.assert_allclose(tsr, [0.0, 1.2, 0.6, 0.4])
+
+
+def test_interpolate_aero_coefficients(sample_blade, sample_airfoil):
+    """Test grouped Cl/Cd interpolation over all blade elements."""
+    blade = sample_blade
+    blade.elements[0].airfoil = sample_airfoil
+    blade.elements[2].airfoil = sample_airfoil
+
+    cl, cd = blade._interpolate_aero_coefficients(np.array([2.5, 5.0, 12.5]))
+
+    # The element without an airfoil gets zero coefficients
+    np.testing.assert_allclose(cl, [0.6, 0.0, 1.0])
+    np.testing.assert_allclose(cd, [0.015, 0.0, 0.035])
+
+
+def test_interpolate_aero_coefficients_multiple_airfoils(
+        sample_blade, sample_airfoil):
+    """Test stacked interpolation across different polars, including clamping."""
+    other_airfoil = Airfoil(
+        name="OtherFoil",
+        reynolds=1e6,
+        control=0,
+        incl_ua_data=False,
+        aero_data=[
+            AeroCoefficients(alpha=-20, cl=-1.0, cd=0.2, cm=0.0),
+            AeroCoefficients(alpha=0, cl=0.0, cd=0.01, cm=0.0),
+            AeroCoefficients(alpha=20, cl=1.5, cd=0.3, cm=0.0),
+        ],
+    )
+    blade = sample_blade
+    blade.elements[0].airfoil = other_airfoil
+    blade.elements[1].airfoil = sample_airfoil
+    blade.elements[2].airfoil = other_airfoil
+
+    alpha_deg = np.array([-10.0, 30.0, 20.0])
+    cl, cd = blade._interpolate_aero_coefficients(alpha_deg)
+
+    expected = [element.airfoil.interp(alpha)
+                for element, alpha in zip(blade.elements, alpha_deg)]
+    np.testing.assert_allclose(cl, [c for c, _ in expected])
+    np.testing.assert_allclose(cd, [d for _, d in expected])
+
+
+def test_polar_table_cache(sample_blade_with_airfoils, sample_airfoil):
+    """Test that the stacked polar table is reused until a polar changes."""
+    blade = sample_blade_with_airfoils
+    table = blade._polar_table()
+    assert blade._polar_table() is table
+
+    sample_airfoil.aero_data = [
+        AeroCoefficients(alpha=0, cl=0.0, cd=0.0, cm=0.0),
+        AeroCoefficients(alpha=10, cl=1.0, cd=0.1, cm=0.0),
+    ]
+    assert blade._polar_table() is not table
+
+    cl, cd = blade._interpolate_aero_coefficients(np.array([5.0, 5.0, 5.0]))
+    np.testing.assert_allclose(cl, 0.5)
+    np.testing.assert_allclose(cd, 0.05)
+
+
+def test_polar_table_follows_airfoil_edits(
+        sample_blade_with_airfoils,
+        sample_airfoil):
+    """Test that the blade and the airfoil always interpolate the same polar."""
+    blade = sample_blade_with_airfoils
+    blade._polar_table()
+
+    # The polar arrays cannot be edited in place behind the cached table
+    with pytest.raises(ValueError):
+        sample_airfoil.cl_arr[:] *= 1.5
+
+    # A replaced polar is picked up by the blade and the airfoil alike
+    table = sample_airfoil.aero_table.copy()
+    table[:, 1] *= 1.5
+    sample_airfoil.aero_data = np.rec.fromarrays(table.T, dtype=AERO_DTYPE)
+    alpha = np.array([2.5, 7.5, 12.5])
+    cl, cd = blade._interpolate_aero_coefficients(alpha)
+    np.testing.assert_allclose(cl, sample_airfoil.interp_fast(alpha)[0])
+    np.testing.assert_allclose(cd, sample_airfoil.interp_fast(alpha)[1])
+
+
+def test_polar_table_validated_once_per_solve(
+        sample_blade_with_airfoils,
+        sample_operational_condition):
+    """Test that a solve validates the polar table once, not per iteration."""
+    blade = sample_blade_with_airfoils
+    condition = sample_operational_condition
+    solvers = (
+        blade.compute_induction_factors_blade,
+        blade.compute_induction_factors_vectorized,
+    )
+    for solver in solvers:
+        with patch.object(blade, "_polar_table", wraps=blade._polar_table) as table:
+            solver(max_iterations=20, operational_condition=condition)
+        assert table.call_count == 1
+
+
 def test_load_from_file_with_invalid_data():
     """Test loading blade data from a file with invalid data."""
     # Create a temporary file with invalid blade data
@@ -305,6 +637,15 @@ def test_plot_blade_shape(sample_blade_with_airfoils):
         assert mock_figure.called
         assert mock_show.called
 
+        # The axis limits are set from the plotted profile points
+        ax = mock_figure.return_value.add_subplot.return_value
+        assert ax.auto_scale_xyz.called
+        _, y_points, _ = ax.auto_scale_xyz.call_args.args
+        np.testing.assert_allclose(
+            np.unique(y_points),
+            [e.r for e in blade.elements if e.airfoil and len(e.airfoil.shape_coords)],
+        )
+
         # We don't verify subplot calls as they're made through add_subplot in
         # the implementation
 
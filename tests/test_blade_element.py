@@ -3,7 +3,7 @@ from src.OperationalCharacteristics import (
     OperationalCharacteristic,
 )
 from src.Airfoil import Airfoil, AeroCoefficients
-from src.BladeElement import BladeElement
+from src.BladeElement import BladeElement, induction_fixed_point
 from src.OperationalCondition import OperationalCondition
 import sys
 from pathlib import Path
@@ -145,6 +145,83 @@ def test_compute_element_induction_factors(sample_blade_element):
     assert a_prime_result != a_prime
 
 
+def test_induction_fixed_point_vectorized():
+    """Test that the array kernel matches solving each element on its own."""
+    r = np.array([5.0, 10.0, 20.0])
+    solidity = np.array([0.2, 0.1, 0.05])
+    Cn = np.array([1.0, 0.9, 0.8])
+    Ct = np.array([0.5, 0.3, 0.1])
+
+    a, a_prime = induction_fixed_point(0.1, 0.1, 10.0, 2.0, r, solidity, Cn, Ct)
+
+    for i in range(len(r)):
+        a_i, a_prime_i = induction_fixed_point(
+            0.1, 0.1, 10.0, 2.0, r[i], solidity[i], Cn[i], Ct[i])
+        assert a[i] == a_i
+        assert a_prime[i] == a_prime_i
+
+
+def test_induction_fixed_point_return_phi():
+    """Test that the returned flow angle belongs to the returned factors."""
+    r = np.array([5.0, 10.0, 20.0])
+    solidity = np.array([0.2, 0.1, 0.05])
+    Cn = np.array([1.0, 0.9, 0.8])
+    Ct = np.array([0.5, 0.3, 0.1])
+
+    # Converged, and stopped by the iteration limit
+    for max_iterations in (100, 2):
+        a, a_prime, phi = induction_fixed_point(
+            0.1, 0.1, 10.0, 2.0, r, solidity, Cn, Ct,
+            max_iterations=max_iterations, return_phi=True)
+        np.testing.assert_array_equal(
+            phi, np.arctan2((1 - a) * 10.0, (1 + a_prime) * 2.0 * r))
+
+
+def test_induction_fixed_point_aitken():
+    """Test that Aitken acceleration reaches the same fixed point sooner."""
+    r = np.array([20.0, 60.0])
+    solidity = np.array([0.05, 0.02])
+    Cn = np.array([1.2, 1.0])
+    Ct = np.array([0.2, 0.1])
+    args = (0.0, 0.0, 10.0, 0.8, r, solidity, Cn, Ct)
+
+    a_ref, a_prime_ref = induction_fixed_point(
+        *args, tolerance=1e-12, max_iterations=1000)
+    a_acc, a_prime_acc = induction_fixed_point(
+        *args, tolerance=1e-12, max_iterations=1000, accelerate=True)
+    np.testing.assert_allclose(a_acc, a_ref, atol=1e-10)
+    np.testing.assert_allclose(a_prime_acc, a_prime_ref, atol=1e-10)
+
+    # With the same small iteration budget the accelerated result is closer
+    a_plain, _ = induction_fixed_point(*args, max_iterations=6)
+    a_fast, _ = induction_fixed_point(*args, max_iterations=6, accelerate=True)
+    assert np.all(np.abs(a_fast - a_ref) < np.abs(a_plain - a_ref))
+
+
+def test_induction_fixed_point_glauert():
+    """Test the Glauert correction of heavily loaded elements."""
+    r = np.array([60.0, 60.0])
+    solidity = np.array([0.02, 0.05])
+    Cn = np.array([1.0, 1.2])
+    Ct = np.array([0.05, 0.2])
+    args = (0.0, 0.0, 10.0, 0.8, r, solidity, Cn, Ct)
+
+    a_ref, _ = induction_fixed_point(*args, tolerance=1e-12,
+                                     max_iterations=1000)
+    a, _, phi = induction_fixed_point(*args, tolerance=1e-12,
+                                      max_iterations=1000, glauert=True,
+                                      return_phi=True)
+
+    # Lightly loaded elements are unaffected
+    assert a_ref[0] < 0.2
+    assert a[0] == a_ref[0]
+
+    # The heavily loaded element satisfies the Spera thrust relation
+    assert 0.2 < a[1] < a_ref[1]
+    ct = solidity[1] * (1 - a[1]) ** 2 * Cn[1] / np.sin(phi[1]) ** 2
+    assert ct == pytest.approx(4 * (0.2 ** 2 + (1 - 2 * 0.2) * a[1]))
+
+
 def test_compute_induction_factors(
     sample_blade_element,
     sample_airfoil,
@@ -204,3 +281,11 @@ def test_compute_induction_factors(
         2.0 <= Cn <= 2.0, f"Normal force coefficient Cn={Cn} outside expected range"
     assert - \
         2.0 <= Ct <= 2.0, f"Tangential force coefficient Ct={Ct} outside expected range"
+
+
+def test_blade_element_slots(sample_blade_element):
+    """Test that blade elements use a fixed attribute layout."""
+    assert not hasattr(sample_blade_element, "__dict__")
+    assert sample_blade_element.a is None
+    with pytest.raises(AttributeError):
+        sample_blade_element.unknown = 1.0
@@ -201,6 +201,27 @@ def test_element_forces_calculation(
         ), "Tangential force calculation error"
 
 
+def test_totals_match_element_contributions(
+        sample_blade_element_theory,
+        sample_operational_condition):
+    """Test that the rotor totals are the sums of the stored element loads."""
+    total_thrust, total_torque, _, _, _ = (
+        sample_blade_element_theory.compute_aerodynamic_performance(
+            operational_condition=sample_operational_condition
+        )
+    )
+
+    elements = sample_blade_element_theory.blade.elements
+    assert total_thrust == pytest.approx(sum(e.dT for e in elements))
+    assert total_torque == pytest.approx(sum(e.dM for e in elements))
+
+    # Momentum theory for the first element
+    element = elements[0]
+    expected_dT = (4 * np.pi * element.r * 1.225 * 10.0**2
+                   * element.a * (1 - element.a) * element.dr)
+    assert element.dT == pytest.approx(expected_dT)
+
+
 def test_zero_wind_speed(sample_blade_element_theory):
     """Test performance calculation with zero wind speed."""
     # Create an operational condition with zero wind speed
@@ -270,6 +291,85 @@ def test_integration_with_blade_class(
         assert element.dM is not None
 
 
+def test_compute_induction_factors_shared_airfoil(
+        sample_blade_element_theory, sample_operational_characteristics):
+    """Test that bracketing elements with one airfoil share its interpolation."""
+    bet = sample_blade_element_theory
+    airfoil = bet.blade.elements[0].airfoil
+    condition = OperationalCondition(wind_speed=10.0)
+    condition.calculate_angular_velocity(bet.blade)
+
+    airfoil.interp_fast = MagicMock(wraps=airfoil.interp_fast)
+    result = bet.compute_induction_factors(
+        radius=3.0,
+        max_iterations=5,
+        tolerance=0.0,
+        operational_characteristics=sample_operational_characteristics,
+        operational_condition=condition,
+    )
+    assert airfoil.interp_fast.call_count == 5
+
+    del airfoil.interp_fast
+    cl, cd = airfoil.interp_fast(result["alpha"])
+    assert result["cl"] == pytest.approx(cl)
+    assert result["cd"] == pytest.approx(cd)
+
+
+@pytest.mark.parametrize("glauert", [False, True])
+def test_compute_aerodynamic_performance_sweep(sample_blade_element_theory, glauert):
+    """Test that a wind speed sweep matches solving each wind speed on its own."""
+    bet = sample_blade_element_theory
+    wind_speeds = np.array([0.0, 5.0, 10.0, 15.0])
+    condition = OperationalCondition(wind_speed=wind_speeds)
+    condition.calculate_angular_velocity(bet.blade)
+
+    sweep = bet.compute_aerodynamic_performance_sweep(condition, glauert=glauert)
+
+    for i, wind_speed in enumerate(wind_speeds):
+        single = OperationalCondition(wind_speed=wind_speed)
+        single.calculate_angular_velocity(bet.blade)
+        bet.blade.compute_induction_factors_blade(
+            operational_condition=single, glauert=glauert)
+        expected = bet.compute_aerodynamic_performance(single)
+        for swept, value in zip(sweep, expected):
+            assert swept[i] == pytest.approx(value, rel=1e-12, abs=1e-12)
+
+
+def test_compute_aerodynamic_performance_sweep_float32(sample_blade_element_theory):
+    """Test that a single precision sweep keeps double precision totals."""
+    bet = sample_blade_element_theory
+    condition = OperationalCondition(wind_speed=np.array([5.0, 10.0, 15.0]))
+    condition.calculate_angular_velocity(bet.blade)
+
+    solution = bet.blade.compute_induction_factors_sweep(
+        operational_condition=condition, dtype=np.float32)
+    assert solution["a"].dtype == np.float32
+
+    expected = bet.compute_aerodynamic_performance_sweep(condition)
+    result = bet.compute_aerodynamic_performance_sweep(
+        condition, dtype=np.float32)
+    for single, double in zip(result, expected):
+        assert single.dtype == np.float64
+        np.testing.assert_allclose(single, double, rtol=1e-4, atol=1e-8)
+
+
+def test_compute_power_curve_parallel(sample_blade_element_theory):
+    """Test that the parallel power curve matches solving each point in turn."""
+    bet = sample_blade_element_theory
+    conditions = []
+    for wind_speed in (5.0, 10.0, 15.0):
+        condition = OperationalCondition(wind_speed=wind_speed)
+        conditions.append(condition.calculate_angular_velocity(bet.blade))
+
+    curves = bet.compute_power_curve_parallel(conditions, n_workers=2)
+
+    for i, condition in enumerate(conditions):
+        bet.blade.compute_induction_factors_blade(operational_condition=condition)
+        expected = bet.compute_aerodynamic_performance(condition)
+        for curve, value in zip(curves, expected):
+            assert curve[i] == pytest.approx(value)
+
+
 def test_init_method():
     """Test the __init__ method of BladeElementTheory."""
     # Create a mock blade
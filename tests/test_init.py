@@ -1,11 +1,12 @@
 from src.PerformanceAnalyzer import PerformanceAnalyzer
 from src.OperationalCondition import OperationalCondition
-from src import save_results, save_plots
+from src import save_results, save_plots, save_performance_curves
 import sys
 from pathlib import Path
 import tempfile
 import os
 from unittest.mock import MagicMock, patch
+import numpy as np
 
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -99,3 +100,30 @@ def test_save_plots(mock_close, mock_savefig):
             assert (
                 filename == expected_filenames[i]
             ), f"Expected {expected_filenames[i]} but got {filename}"
+
+
+def test_save_performance_curves():
+    """Test that the wind speed sweep is written as a table and an archive."""
+    performance_analyzer = MagicMock(spec=PerformanceAnalyzer)
+    wind_speeds = np.array([5.0, 10.0, 15.0])
+    performance_analyzer.performance_metrics = {
+        "wind_speed": wind_speeds,
+        "thrust": wind_speeds * 100,
+        "torque": wind_speeds * 200,
+        "power": wind_speeds * 300,
+        "ct": np.full(3, 0.7),
+        "cp": np.full(3, 0.4),
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_folder = Path(temp_dir) / "curves"
+        save_performance_curves(output_folder, performance_analyzer)
+
+        table = np.loadtxt(output_folder / "performance_curves.txt")
+        assert table.shape == (3, 6)
+        np.testing.assert_allclose(table[:, 0], wind_speeds)
+        np.testing.assert_allclose(table[:, 3], wind_speeds * 300)
+
+        with np.load(output_folder / "performance_curves.npz") as archive:
+            np.testing.assert_array_equal(archive["thrust"], wind_speeds * 100)
+            np.testing.assert_array_equal(archive["cp"], np.full(3, 0.4))
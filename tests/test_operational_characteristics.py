@@ -207,6 +207,12 @@ def test_plot_characteristics(
     # Expected wind speeds: linspace from 0 to 20 with 5 points
     expected_wind_speeds = np.linspace(0, 20, 5)
     np.testing.assert_array_almost_equal(x_values, expected_wind_speeds)
+    np.testing.assert_array_equal(y_values, [1.0, 1.0, 2.0, 3.0, 3.0])
+
+    # The second call is for the angular velocity of the closest points
+    _, omega_values = mock_plot.call_args_list[1][0]
+    np.testing.assert_array_almost_equal(
+        omega_values, np.array([6.0, 6.0, 8.0, 10.0, 10.0]) * 2 * np.pi / 60)
 
     # Check that appropriate labels and titles were set
     mock_xlabel.assert_called_once_with("Wind Speed (m/s)")
@@ -216,3 +222,47 @@ def test_plot_characteristics(
     mock_legend.assert_called_once()
     mock_grid.assert_called_once()
     mock_show.assert_called_once()
+
+
+def test_lookup_arrays_follow_characteristics():
+    """Test that the cached arrays track the operating points and interpolate."""
+    characteristics = OperationalCharacteristics([
+        OperationalCharacteristic(5.0, 0.0, 6.0, 0, 0),
+        OperationalCharacteristic(10.0, 2.0, 8.0, 0, 0),
+    ])
+
+    np.testing.assert_array_equal(characteristics.wind_speed_arr, [5.0, 10.0])
+    np.testing.assert_array_equal(
+        characteristics.omega_arr,
+        [op.omega for op in characteristics.characteristics])
+    assert characteristics.pitch_angle(7.5) == pytest.approx(np.radians(1.0))
+    assert characteristics.rotor_speed(7.5) == pytest.approx(7.0)
+
+    characteristics.characteristics = [
+        OperationalCharacteristic(5.0, 4.0, 6.0, 0, 0)]
+    np.testing.assert_array_equal(characteristics.pitch_rad_arr, [np.radians(4.0)])
+
+    # Operating points appended to the list are picked up as well
+    characteristics.characteristics.append(
+        OperationalCharacteristic(15.0, 8.0, 7.0, 0, 0))
+    np.testing.assert_array_equal(characteristics.wind_speed_arr, [5.0, 15.0])
+    assert characteristics.pitch_angle(10.0) == pytest.approx(np.radians(6.0))
+    assert characteristics.rotor_speed(10.0) == pytest.approx(6.5)
+
+
+def test_closest_indices_match_linear_scan():
+    """Test the closest operating point lookup on an unsorted table with ties."""
+    characteristics = OperationalCharacteristics([
+        OperationalCharacteristic(wind_speed, 0.0, 6.0, 0, 0)
+        for wind_speed in (10.0, 4.0, 10.0, 6.0)
+    ])
+    wind_speeds = np.array([0.0, 5.0, 7.0, 8.0, 9.0, 12.0])
+
+    expected = [
+        characteristics.characteristics.index(min(
+            characteristics.characteristics,
+            key=lambda x: abs(x.wind_speed - wind_speed)))
+        for wind_speed in wind_speeds
+    ]
+    np.testing.assert_array_equal(
+        characteristics._closest_indices(wind_speeds), expected)
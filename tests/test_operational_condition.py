@@ -119,3 +119,18 @@ def test_calculate_angular_velocity():
     assert condition.rpm == pytest.approx(expected_rpm)
     expected_omega = expected_rpm * 2 * np.pi / 60
     assert condition.omega == pytest.approx(expected_omega)
+    assert condition.pitch_rad == pytest.approx(np.radians(1.0))
+    assert condition.pitch_angle(mock_op_chars) is condition.pitch_rad
+
+    # Without a blade the pitch angle is interpolated on request
+    condition = OperationalCondition(wind_speed=12.5)
+    assert condition.pitch_rad is None
+    assert condition.pitch_angle(mock_op_chars) == pytest.approx(np.radians(3.0))
+
+    # A changed wind speed or pitch table is interpolated again
+    condition.wind_speed = 15.0
+    assert condition.pitch_angle(mock_op_chars) == pytest.approx(np.radians(4.0))
+    mock_op_chars.characteristics = [
+        OperationalCharacteristic(
+            wind_speed=15.0, pitch=6.0, rpm=10.0, aero_power=0, aero_thrust=0)]
+    assert condition.pitch_angle(mock_op_chars) == pytest.approx(np.radians(6.0))
@@ -104,10 +104,72 @@ def test_calculate_performance(
     assert len(result["cp"]) == 10
 
     # Check that mocks were called correctly
-    assert MockOperationalCondition.call_count == 10
-    assert MockBET.call_count == 10
+    # One condition interpolates the operating table, then one per wind speed
+    assert MockOperationalCondition.call_count == 11
+    MockBET.assert_called_once_with(blade=mock_blade)
     assert mock_bet_instance.compute_aerodynamic_performance.call_count == 10
-    assert mock_op_condition.calculate_angular_velocity.call_count == 10
+    assert mock_op_condition.calculate_angular_velocity.call_count == 1
+    assert mock_blade.compute_induction_factors_blade.call_count == 10
+
+
+@patch("src.PerformanceAnalyzer.OperationalCondition")
+@patch("src.PerformanceAnalyzer.BladeElementTheory")
+def test_calculate_performance_vectorized(
+        MockBET,
+        MockOperationalCondition,
+        performance_analyzer,
+        mock_blade):
+    """Test that the vectorized calculation solves all wind speeds in one call."""
+    mock_op_condition = MagicMock()
+    MockOperationalCondition.return_value = mock_op_condition
+
+    mock_bet_instance = MagicMock()
+    mock_bet_instance.compute_aerodynamic_performance_sweep.return_value = tuple(
+        np.full(10, value) for value in (1000.0, 2000.0, 3000.0, 0.5, 0.4))
+    MockBET.return_value = mock_bet_instance
+
+    result = performance_analyzer.calculate_performance(vectorized=True)
+
+    assert performance_analyzer._performance_calculated is True
+    np.testing.assert_array_equal(result["power"], np.full(10, 3000.0))
+    np.testing.assert_array_equal(result["thrust"], np.full(10, 1000.0))
+    np.testing.assert_array_equal(result["cp"], np.full(10, 0.4))
+
+    # One operating condition carries every wind speed
+    MockOperationalCondition.assert_called_once()
+    np.testing.assert_array_equal(
+        MockOperationalCondition.call_args.kwargs["wind_speed"],
+        performance_analyzer.wind_speeds)
+    mock_op_condition.calculate_angular_velocity.assert_called_once()
+    mock_bet_instance.compute_aerodynamic_performance_sweep.assert_called_once()
+    mock_blade.compute_induction_factors_blade.assert_not_called()
+
+
+@patch("src.PerformanceAnalyzer.BladeElementTheory")
+def test_calculate_performance_parallel(MockBET, performance_analyzer, mock_blade):
+    """Test that the parallel calculation hands every operating point to the pool."""
+    mock_blade.operational_characteristics = MagicMock()
+    mock_blade.operational_characteristics.rotor_speed.side_effect = (
+        lambda wind_speed: np.asarray(wind_speed) / 2)
+    mock_blade.operational_characteristics.pitch_angle.side_effect = (
+        lambda wind_speed: np.zeros_like(wind_speed))
+
+    mock_bet_instance = MagicMock()
+    mock_bet_instance.compute_power_curve_parallel.return_value = tuple(
+        np.full(10, value) for value in (1000.0, 2000.0, 3000.0, 0.5, 0.4))
+    MockBET.return_value = mock_bet_instance
+
+    result = performance_analyzer.calculate_performance(parallel=True, n_workers=2)
+
+    np.testing.assert_array_equal(result["power"], np.full(10, 3000.0))
+    np.testing.assert_array_equal(result["torque"], np.full(10, 2000.0))
+
+    (conditions,), kwargs = mock_bet_instance.compute_power_curve_parallel.call_args
+    assert kwargs == {"n_workers": 2}
+    assert [c.wind_speed for c in conditions] == list(performance_analyzer.wind_speeds)
+    assert conditions[-1].rpm == 7.5
+    assert conditions[-1].omega == pytest.approx(7.5 * 2 * np.pi / 60)
+    mock_blade.compute_induction_factors_blade.assert_not_called()
 
 
 def test_performance_metrics_property(performance_analyzer):
@@ -272,3 +334,28 @@ def test_ensure_performance_calculated(performance_analyzer):
         performance_analyzer._performance_calculated = True
         performance_analyzer._ensure_performance_calculated()
         assert not mock_calculate.called
+
+
+@patch("matplotlib.pyplot.figure")
+@patch("matplotlib.pyplot.plot")
+def test_plots_share_one_sweep(mock_plot, mock_figure, performance_analyzer):
+    """Test that the three plot methods reuse a single performance sweep."""
+    def fake_sweep():
+        performance_analyzer._performance_metrics = {
+            "wind_speed": [5, 10, 15],
+            "power": [1000, 2000, 3000],
+            "thrust": [500, 1000, 1500],
+            "torque": [300, 600, 900],
+            "ct": [0.5, 0.6, 0.7],
+            "cp": [0.4, 0.5, 0.6],
+        }
+        performance_analyzer._performance_calculated = True
+
+    with patch.object(
+        performance_analyzer, "calculate_performance", side_effect=fake_sweep
+    ) as mock_calculate:
+        performance_analyzer.plot_power_curve()
+        performance_analyzer.plot_thrust_curve()
+        performance_analyzer.plot_torque_curve()
+
+    assert mock_calculate.call_count == 1